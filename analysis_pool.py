@@ -0,0 +1,134 @@
+#############################################################
+# FILE: analysis_pool.py
+# AUTHORS: 1. Amir Harel
+#          2. Nadav Porat
+# EXERCISE: Exercise 12
+# DESCRIPTION: Solves large sets of boards on every core, with a single
+#              lexicon shared by all the worker processes
+#############################################################
+
+import functools
+import multiprocessing
+import os
+import time
+
+from boggle_solver import solve_board, max_score
+from lexicon import load_lexicon
+
+'''Magic Variables'''
+# how many boards are sent to a worker in a single task
+CHUNK_SIZE = 256
+
+# the lexicon used by analyse_chunk. it is set in the parent before the
+# workers fork, so they inherit the already mapped lexicon instead of
+# loading their own
+_lexicon = None
+
+
+def _init_worker(dict_path):
+    # only needed when the workers are spawned instead of forked, mapping
+    # the compiled file again still shares its pages between processes
+    global _lexicon
+    if _lexicon is None:
+        _lexicon = load_lexicon(dict_path)
+
+
+def analyse_board(board, lexicon, with_words=False):
+    """
+    solves a single board and returns the record that describes it
+    """
+    words = solve_board(board, lexicon)
+    record = {
+        'board': board,
+        'word_count': len(words),
+        'max_score': max_score(words),
+        'longest': max(words, key=len, default='')
+    }
+    if with_words:
+        record['words'] = words
+    return record
+
+
+def analyse_chunk(boards, with_words=False):
+    return [analyse_board(board, _lexicon, with_words) for board in boards]
+
+
+def chunked(items, size):
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+class AnalysisPool:
+    """
+    solves boards in worker processes. the lexicon is loaded once in the
+    parent process and inherited by the workers, boards are sent to the
+    workers in chunks to keep the messaging overhead low
+    """
+
+    def __init__(self, dict_path, workers=None, chunk_size=CHUNK_SIZE):
+        global _lexicon
+        _lexicon = load_lexicon(dict_path)
+        self.__workers = workers or os.cpu_count() or 1
+        self.__chunk_size = chunk_size
+        self.__boards = 0  # boards analysed so far
+        self.__seconds = 0.0  # time spent analysing them
+        self.__pool = None
+        if self.__workers > 1:
+            methods = multiprocessing.get_all_start_methods()
+            context = multiprocessing.get_context(
+                'fork' if 'fork' in methods else None)
+            self.__pool = context.Pool(self.__workers, _init_worker,
+                                       (dict_path,))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        if self.__pool is not None:
+            self.__pool.close()
+            self.__pool.join()
+            self.__pool = None
+
+    def analyse(self, boards, with_words=False):
+        """
+        yields a record for each board, in the order of boards
+        """
+        analyse = functools.partial(analyse_chunk, with_words=with_words)
+        chunks = chunked(boards, self.__chunk_size)
+        if self.__pool is None:
+            results = map(analyse, chunks)
+        else:
+            results = self.__pool.imap(analyse, chunks)
+        start = time.perf_counter()
+        try:
+            for records in results:
+                self.__boards += len(records)
+                yield from records
+        finally:
+            self.__seconds += time.perf_counter() - start
+
+    def get_workers(self):
+        return self.__workers
+
+    def get_boards(self):
+        return self.__boards
+
+    def get_seconds(self):
+        return self.__seconds
+
+    def get_rate(self):
+        """
+        returns the number of boards analysed per second so far
+        """
+        if not self.__seconds:
+            return 0.0
+        return self.__boards / self.__seconds
@@ -0,0 +1,110 @@
+#############################################################
+# FILE: board_layout.py
+# AUTHORS: 1. Amir Harel
+#          2. Nadav Porat
+# EXERCISE: Exercise 12
+# DESCRIPTION: Adjacency of the cells of a board, computed once per size
+#############################################################
+
+import functools
+
+
+@functools.lru_cache(maxsize=None)
+def neighbour_table(rows, cols=None):
+    """
+    returns a dictionary from every location on a rows x cols board to the
+    tuple of locations adjacent to it. tables are cached, so every board of
+    the same size shares one
+    """
+    if cols is None:
+        cols = rows
+    table = {}
+    for i in range(rows):
+        for j in range(cols):
+            table[(i, j)] = tuple((i + di, j + dj)
+                                  for di in (-1, 0, 1)
+                                  for dj in (-1, 0, 1)
+                                  if (di or dj)
+                                  and 0 <= i + di < rows
+                                  and 0 <= j + dj < cols)
+    return table
+
+
+@functools.lru_cache(maxsize=None)
+def neighbour_masks(rows, cols=None):
+    """
+    returns a list with a bitmask of the adjacent cells of every cell, cells
+    are numbered row after row
+    """
+    if cols is None:
+        cols = rows
+    return [sum(1 << (i * cols + j) for i, j in neighbours)
+            for neighbours in neighbour_table(rows, cols).values()]
+
+
+class PressPath:
+    """
+    the tiles the player pressed so far, kept as a list and as a bitmask so
+    the tiles that can be pressed next are found with a couple of bitwise
+    operations
+    """
+
+    def __init__(self, rows, cols=None):
+        if cols is None:
+            cols = rows
+        self.__cols = cols
+        self.__masks = neighbour_masks(rows, cols)
+        self.__all = (1 << (rows * cols)) - 1  # every cell on the board
+        self.clear()
+
+    def __len__(self):
+        return len(self.__path)
+
+    def clear(self):
+        self.__path = []
+        self.__pressed = 0  # bitmask of the pressed cells
+
+    def get_index(self, location):
+        return location[0] * self.__cols + location[1]
+
+    def get_location(self, index):
+        return divmod(index, self.__cols)
+
+    def press(self, location):
+        self.__path.append(location)
+        self.__pressed |= 1 << self.get_index(location)
+
+    def pop(self):
+        """
+        removes the last pressed tile and returns its location
+        """
+        location = self.__path.pop()
+        self.__pressed &= ~(1 << self.get_index(location))
+        return location
+
+    def is_pressed(self, location):
+        return bool(self.__pressed >> self.get_index(location) & 1)
+
+    def get_path(self):
+        return list(self.__path)
+
+    def get_enabled(self):
+        """
+        returns a bitmask of the tiles that can be pressed now - the free
+        neighbours of the last pressed tile, and the last tile itself so it
+        can be unpressed
+        """
+        if not self.__path:
+            return self.__all
+        last = self.get_index(self.__path[-1])
+        return (self.__masks[last] & ~self.__pressed) | (1 << last)
+
+
+def iter_bits(mask):
+    """
+    yields the index of every set bit of mask
+    """
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
@@ -0,0 +1,221 @@
+#############################################################
+# FILE: board_quality.py
+# AUTHORS: 1. Amir Harel
+#          2. Nadav Porat
+# EXERCISE: Exercise 12
+# DESCRIPTION: Generates only boards with enough words on them, and keeps
+#              a pool of such boards ready in the background
+#############################################################
+
+import argparse
+import json
+import queue
+import random
+import sys
+import threading
+import time
+
+from boggle_board_randomizer import BOARD_SIZE, DICE, randomize_board
+from boggle_solver import solve_board, max_score
+from lexicon_registry import DEFAULT_LEXICON, REGISTRY
+
+'''Magic Variables'''
+# Default requirements, about one board in ten is rejected with these
+MIN_WORDS = 80
+MIN_SCORE = 1000
+MIN_LONG_WORDS = 2
+LONG_WORD_LENGTH = 6
+# How many boards are tried before giving up on the requirements
+MAX_TRIES = 1000
+# How many boards the pool keeps ready
+POOL_SIZE = 3
+SUMMARY = ('{} of {} boards accepted in {:.2f}s '
+           '({:.0f} boards/sec, {:.0f} accepted/sec)')
+
+
+class SolvedBoard:
+    """
+    a board together with its answer key - every word on it and the best
+    score a player can get
+    """
+
+    def __init__(self, board, words):
+        self.__board = board
+        self.__words = words  # word -> path, as returned by solve_board
+        self.__max_score = max_score(words)
+
+    def get_board(self):
+        return self.__board
+
+    def get_words(self):
+        return self.__words
+
+    def get_max_score(self):
+        return self.__max_score
+
+
+class BoardFilter:
+    """
+    rejects boards that don't have enough words on them. every board it
+    generates is solved, so the words found come with the board
+    """
+
+    def __init__(self, lexicon, min_words=MIN_WORDS, min_score=MIN_SCORE,
+                 min_long_words=MIN_LONG_WORDS,
+                 long_length=LONG_WORD_LENGTH):
+        self.__lexicon = lexicon
+        self.__min_words = min_words
+        self.__min_score = min_score
+        self.__min_long_words = min_long_words
+        self.__long_length = long_length
+        self.__tries = 0  # boards generated
+        self.__accepted = 0  # boards that met the requirements
+        self.__seconds = 0.0  # time spent generating boards
+        self.__lock = threading.Lock()
+
+    def accepts(self, words):
+        """
+        checks whether the words found on a board meet the requirements
+        """
+        if len(words) < self.__min_words or max_score(words) < \
+                self.__min_score:
+            return False
+        long_words = sum(len(word) >= self.__long_length for word in words)
+        return long_words >= self.__min_long_words
+
+    def generate(self, rng=random, size=BOARD_SIZE, dice=None,
+                 max_tries=MAX_TRIES):
+        """
+        generates boards until one meets the requirements and returns it
+        with the words found on it. after max_tries boards the best board
+        found so far is returned
+        """
+        start = time.perf_counter()
+        best = None
+        tries = 0
+        try:
+            while tries < max_tries:
+                tries += 1
+                board = randomize_board(rng, size, dice)
+                words = solve_board(board, self.__lexicon)
+                if self.accepts(words):
+                    with self.__lock:
+                        self.__accepted += 1
+                    return board, words
+                if best is None or len(words) > len(best[1]):
+                    best = board, words
+            return best
+        finally:
+            with self.__lock:
+                self.__tries += tries
+                self.__seconds += time.perf_counter() - start
+
+    def get_stats(self):
+        """
+        returns (boards tried, boards accepted, seconds spent)
+        """
+        with self.__lock:
+            return self.__tries, self.__accepted, self.__seconds
+
+    def get_rate(self):
+        """
+        returns the number of accepted boards generated per second
+        """
+        tries, accepted, seconds = self.get_stats()
+        return accepted / seconds if seconds else 0.0
+
+
+class QualityBoardPool:
+    """
+    keeps up to capacity boards that passed a BoardFilter ready, already
+    solved, refilling in a background thread so taking a board never waits
+    for the search or the solver. the thread sleeps while the pool is full
+    """
+
+    def __init__(self, board_filter, size=BOARD_SIZE, dice=None,
+                 capacity=POOL_SIZE, seed=None):
+        self.__filter = board_filter
+        self.__size = size
+        self.__dice = dice
+        self.__rng = random.Random(seed)
+        # ready boards, or the error that stopped the thread making them
+        self.__boards = queue.Queue(capacity)
+        self.__stopped = threading.Event()
+        self.__thread = threading.Thread(target=self.__fill, daemon=True)
+        self.__thread.start()
+
+    def __fill(self):
+        try:
+            while not self.__stopped.is_set():
+                board = SolvedBoard(*self.__filter.generate(
+                    self.__rng, self.__size, self.__dice))
+                self.__boards.put(board)  # waits for a free place
+        except Exception as error:  # raised by get() instead of lost
+            self.__boards.put(error)
+
+    def get(self):
+        """
+        returns a ready SolvedBoard. if the pool ran empty, waits for the
+        board the thread is making rather than making another one
+        """
+        board = self.__boards.get()
+        if isinstance(board, Exception):
+            self.__boards.put(board)  # every later get() fails the same way
+            raise board
+        return board
+
+    def get_ready(self):
+        return self.__boards.qsize()
+
+    def stop(self):
+        """
+        stops making boards. a thread waiting for a free place is given one,
+        so it sees it was stopped and ends
+        """
+        self.__stopped.set()
+        try:
+            self.__boards.get_nowait()
+        except queue.Empty:
+            pass
+
+    def join(self, timeout=None):
+        # waits until the thread ended, after stop()
+        self.__thread.join(timeout)
+        return not self.__thread.is_alive()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description='Generate boards that meet word count requirements')
+    parser.add_argument('-n', '--boards', type=int, default=100,
+                        help='number of boards to generate')
+    parser.add_argument('-s', '--seed', type=int, default=None,
+                        help='random seed, for reproducible runs')
+    parser.add_argument('--size', type=int, default=BOARD_SIZE,
+                        choices=sorted(DICE), help='board size')
+    parser.add_argument('--lexicon', default=DEFAULT_LEXICON,
+                        choices=REGISTRY.get_names(), help='language')
+    parser.add_argument('--min-words', type=int, default=MIN_WORDS)
+    parser.add_argument('--min-score', type=int, default=MIN_SCORE)
+    parser.add_argument('--min-long-words', type=int,
+                        default=MIN_LONG_WORDS)
+    parser.add_argument('--long-length', type=int, default=LONG_WORD_LENGTH)
+    args = parser.parse_args(argv)
+
+    board_filter = BoardFilter(REGISTRY.get_lexicon(args.lexicon),
+                               args.min_words, args.min_score,
+                               args.min_long_words, args.long_length)
+    rng = random.Random(args.seed)
+    dice = REGISTRY.get_dice(args.lexicon)
+    for _ in range(args.boards):
+        board, words = board_filter.generate(rng, args.size, dice)
+        print(json.dumps({'board': board, 'word_count': len(words),
+                          'max_score': max_score(words)}))
+    tries, accepted, seconds = board_filter.get_stats()
+    seconds = seconds or sys.float_info.epsilon
+    print(SUMMARY.format(accepted, tries, seconds, tries / seconds,
+                         accepted / seconds), file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
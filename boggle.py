@@ -7,94 +7,128 @@
 #############################################################
 
 from screen import Screen
-from boggle_board_randomizer import *
+from board_quality import BoardFilter, QualityBoardPool
+from game_engine import GameEngine
+from game_history import GameHistory
+from replay_log import writer_from_env
+from game_state import GameStateMachine
+from lexicon import BackgroundLexicon
+from lexicon_registry import DEFAULT_LEXICON, REGISTRY
+import functools
 import sys
 
 '''Magic Variables'''
 TITLE = 'Boggle - By Amir Harel and Nadav Porat'
-# dictionary that will do the desired function given games status
+# dictionary that will do the desired function given games event
 ENDING_NEW = {
+    'start': lambda self: self.start_game(),
+    'tick': lambda self, seconds: self.log_tick(seconds),
+    'end': lambda self: self.record_game(),
     'exit': lambda self: sys.exit(),
-    'retry': lambda self: self.restart()
+    'retry': lambda self: self.restart(),
+    'settings': lambda self: self.apply_settings()
 }
 
 
-class BoardItem:
-    """
-    class that each item represents the data of a specific item in the board
-    """
-
-    def __init__(self, data, location):
-        self.__data = data
-        self.__is_pressed = False
-        self.__location = location  # coordinates
-
-    def __str__(self):
-        return f'{self.__data}'
-
-    def get_data(self):
-        return self.__data
-
-    def press(self):
-        if self.__is_pressed:
-            self.__is_pressed = False
-        else:
-            self.__is_pressed = True
-
-    def get_status(self):
-        return self.__is_pressed
-
-    def get_location(self):
-        return self.__location
-
-
 class BoggleGame:
 
     def __init__(self):
-        self.__screen = Screen()
+        self.__events = GameStateMachine()
+        for event, action in ENDING_NEW.items():
+            self.__events.on(event, functools.partial(action, self))
+        self.__screen = Screen(self.__events)
         self.init_game()
 
     def init_game(self):
         self.__screen.set_title(TITLE)
-        self.board = randomize_board()
-        self.__screen.set_board(self.get_board())
-        self.__screen.set_dict(parse_boggle_dict())
-
-    def get_board(self):
-        board_dict = {}
-        for i, row in enumerate(randomize_board()):
-            for j, item in enumerate(row):
-                board_dict[(i, j)] = BoardItem(item, (i, j))
-        return board_dict
-
-    def init_monitor(self):
+        # every language is offered with the board sizes it has dice for
+        self.__screen.set_languages({name: REGISTRY.get_sizes(name)
+                                     for name in REGISTRY.get_names()},
+                                    DEFAULT_LEXICON)
+        self.__lexicons = {}  # language -> its lexicon, loaded on first use
+        self.__pool = None  # Boards with enough words, ready to be played
+        self.__pool_settings = None  # (language, size) of the pool's boards
+        self.__game = None  # The GameEngine of the current game
+        self.__history = GameHistory()  # Finished games, for the leaderboard
+        self.__screen.set_leaderboard(self.__history.top())
+        self.__log = writer_from_env()  # Every round played, None if off
+        self.get_pool()  # starts preparing boards while the player waits
+
+    def get_lexicon(self):
+        language = self.__screen.get_language()
+        if language not in self.__lexicons:
+            self.__lexicons[language] = parse_boggle_dict(language)
+        return self.__lexicons[language]
+
+    def get_pool(self):
         """
-        need to add after that will make this function update all the time.
-        from here we call relevant functions according to users commands
+        returns the pool of boards for the current language and size
         """
-        root = self.__screen.get_root()
-        status = self.__screen.get_game_status()
-        if status:
-            ENDING_NEW[status](self)  # ends or restarts game
-        root.after(100, self.init_monitor)  # runs loop on int monitor
+        language = self.__screen.get_language()
+        size = self.__screen.get_board_size()
+        if self.__pool_settings != (language, size):
+            if self.__pool is not None:
+                self.__pool.stop()
+            board_filter = BoardFilter(self.get_lexicon())
+            self.__pool = QualityBoardPool(board_filter, size,
+                                           REGISTRY.get_dice(language))
+            self.__pool_settings = (language, size)
+        return self.__pool
+
+    def get_board(self):
+        # a board from the pool, solved in the background before it's needed
+        return self.get_pool().get()
+
+    def new_game(self):
+        # the engine holds the rules of the game, the screen only shows it
+        solved = self.get_board()
+        if self.__log is not None:
+            self.__log.start_round(solved.get_board(),
+                                   self.__screen.get_player())
+        return GameEngine(solved.get_board(), self.get_lexicon(),
+                          solved.get_words(), self.__log,
+                          solved.get_max_score())
+
+    def start_game(self):
+        # the player pressed start, a ready board is taken from the pool
+        self.__game = self.new_game()
+        self.__screen.set_game(self.__game)
+
+    def record_game(self):
+        # the game ended, it's saved in the background and the leaderboard
+        # shows it right away
+        game = self.__game
+        self.__history.record(self.__screen.get_player(), game.get_board(),
+                              game.get_bank(), game.get_score(),
+                              self.__screen.get_elapsed())
+        self.__screen.set_leaderboard(self.__history.top())
+        if self.__log is not None:
+            self.__log.end_round(game.get_score())
+
+    def log_tick(self, seconds):
+        if self.__log is not None:
+            self.__log.tick(seconds)
 
     def play(self):
-        self.init_monitor()
+        # everything from here on is driven by the events of the screen
         self.__screen.start_screen()
 
+    def apply_settings(self):
+        # the board size or language was changed in the options, the pool
+        # starts preparing boards for the new settings
+        self.get_pool()
+
     def restart(self):
-        self.__screen.set_board(self.get_board())
-        self.__screen.reset_screen()  # need to create this function
-        self.play()
+        self.__screen.reset_screen()
 
 
-def parse_boggle_dict():
-    file = open('boggle_dict.txt', 'r')
-    dictt = file.read()
-    file.close()
-    dictt = dictt.split('\n')
-    return dictt[:-1]
+def parse_boggle_dict(language=DEFAULT_LEXICON):
+    # the dictionary is compiled once into a .lex file and memory mapped on
+    # every later start. it loads in the background while the start screen
+    # is shown, a word checked before that waits for it
+    return BackgroundLexicon(REGISTRY.get_lexicon, language)
 
 
-boggle = BoggleGame()
-boggle.play()
+if __name__ == '__main__':
+    boggle = BoggleGame()
+    boggle.play()
@@ -0,0 +1,70 @@
+#############################################################
+# FILE: boggle_batch.py
+# AUTHORS: 1. Amir Harel
+#          2. Nadav Porat
+# EXERCISE: Exercise 12
+# DESCRIPTION: Generates and solves boards without a display, writing one
+#              JSON line per board
+#############################################################
+
+import argparse
+import json
+import sys
+
+from analysis_pool import AnalysisPool
+from boggle_board_randomizer import BOARD_SIZE, DICE, generate_boards, \
+    iter_boards
+from lexicon_registry import DEFAULT_LEXICON, REGISTRY
+
+'''Magic Variables'''
+DEFAULT_DICT = REGISTRY.get_path(DEFAULT_LEXICON)
+SUMMARY = '{} boards in {:.2f}s ({:.0f} boards/sec on {} workers)'
+
+
+def run(count, seed=None, workers=1, output=sys.stdout,
+        dict_path=DEFAULT_DICT, with_words=False, size=BOARD_SIZE):
+    """
+    generates count boards, solves them and writes a JSON line for each one
+    to output. returns the AnalysisPool that solved them, for its statistics
+    """
+    # the boards are kept packed and only decoded as they are analysed
+    boards = iter_boards(generate_boards(count, seed, size), size)
+    with AnalysisPool(dict_path, workers) as pool:
+        for record in pool.analyse(boards, with_words):
+            output.write(json.dumps(record) + '\n')
+    return pool
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description='Generate and solve boggle boards without a display')
+    parser.add_argument('-n', '--boards', type=int, default=1000,
+                        help='number of boards to generate')
+    parser.add_argument('-s', '--seed', type=int, default=None,
+                        help='random seed, for reproducible runs')
+    parser.add_argument('-w', '--workers', type=int, default=1,
+                        help='number of worker processes, 0 for one per core')
+    parser.add_argument('-o', '--output', default='-',
+                        help='output file, - for stdout')
+    parser.add_argument('-d', '--dict', default=DEFAULT_DICT,
+                        help='dictionary file')
+    parser.add_argument('--size', type=int, default=BOARD_SIZE,
+                        choices=sorted(DICE), help='board size')
+    parser.add_argument('--words', action='store_true',
+                        help='include every word and its path')
+    args = parser.parse_args(argv)
+
+    output = sys.stdout if args.output == '-' else open(args.output, 'w')
+    try:
+        pool = run(args.boards, args.seed, args.workers, output, args.dict,
+                   args.words, args.size)
+    finally:
+        if output is not sys.stdout:
+            output.close()
+    print(SUMMARY.format(pool.get_boards(), pool.get_seconds(),
+                         pool.get_rate(), pool.get_workers()),
+          file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
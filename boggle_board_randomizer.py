@@ -1,30 +1,153 @@
 import random
 
-def randomize_board():
-    letters = [
-        ['A','E','A','N','E','G'],
-        ['A','H','S','P','C','O'],
-        ['A','S','P','F','F','K'],
-        ['O','B','J','O','A','B'],
-        ['I','O','T','M','U','C'],
-        ['R','Y','V','D','E','L'],
-        ['L','R','E','I','X','D'],
-        ['E','I','U','N','E','S'],
-        ['W','N','G','E','E','H'],
-        ['L','N','H','N','R','Z'],
-        ['T','S','T','I','Y','D'],
-        ['O','W','T','O','A','T'],
-        ['E','R','T','T','Y','L'],
-        ['T','O','E','S','S','I'],
-        ['T','E','R','W','H','V'],
-        ['N','U','I','H','M','Qu']
-    ]
-    
-    board = []
-    for i in range(4):
-        row = []
-        for j in range(4):
-            letter = random.choice(letters[i*4 +j])
-            row.append(letter)
-        board.append(row)
-    return board
+LETTERS = [
+    ['A','E','A','N','E','G'],
+    ['A','H','S','P','C','O'],
+    ['A','S','P','F','F','K'],
+    ['O','B','J','O','A','B'],
+    ['I','O','T','M','U','C'],
+    ['R','Y','V','D','E','L'],
+    ['L','R','E','I','X','D'],
+    ['E','I','U','N','E','S'],
+    ['W','N','G','E','E','H'],
+    ['L','N','H','N','R','Z'],
+    ['T','S','T','I','Y','D'],
+    ['O','W','T','O','A','T'],
+    ['E','R','T','T','Y','L'],
+    ['T','O','E','S','S','I'],
+    ['T','E','R','W','H','V'],
+    ['N','U','I','H','M','Qu']
+]
+# Big Boggle dice
+BIG_LETTERS = [
+    ['A','A','A','F','R','S'],
+    ['A','A','E','E','E','E'],
+    ['A','A','F','I','R','S'],
+    ['A','D','E','N','N','N'],
+    ['A','E','E','E','E','M'],
+    ['A','E','E','G','M','U'],
+    ['A','E','G','M','N','N'],
+    ['A','F','I','R','S','Y'],
+    ['B','J','K','Qu','X','Z'],
+    ['C','C','E','N','S','T'],
+    ['C','E','I','I','L','T'],
+    ['C','E','I','L','P','T'],
+    ['C','E','I','P','S','T'],
+    ['D','D','H','N','O','T'],
+    ['D','H','H','L','O','R'],
+    ['D','H','L','N','O','R'],
+    ['D','H','L','N','O','R'],
+    ['E','I','I','I','T','T'],
+    ['E','M','O','T','T','T'],
+    ['E','N','S','S','S','U'],
+    ['F','I','P','R','S','Y'],
+    ['G','O','R','R','V','W'],
+    ['I','P','R','R','R','Y'],
+    ['N','O','O','T','U','W'],
+    ['O','O','O','T','T','U']
+]
+# Super Big Boggle dice, the blank faces of its EIO die are rolled as
+# letters since the game has no blank tiles
+SUPER_BIG_LETTERS = [
+    ['A','A','A','F','R','S'],
+    ['A','A','E','E','E','E'],
+    ['A','A','E','E','O','O'],
+    ['A','A','F','I','R','S'],
+    ['A','B','D','E','I','O'],
+    ['A','D','E','N','N','N'],
+    ['A','E','E','E','E','M'],
+    ['A','E','E','G','M','U'],
+    ['A','E','G','M','N','N'],
+    ['A','E','I','L','M','N'],
+    ['A','E','I','N','O','U'],
+    ['A','F','I','R','S','Y'],
+    ['An','Er','He','In','Qu','Th'],
+    ['B','B','J','K','X','Z'],
+    ['C','C','E','N','S','T'],
+    ['C','D','D','L','N','N'],
+    ['C','E','I','I','T','T'],
+    ['C','E','I','P','S','T'],
+    ['C','F','G','N','U','Y'],
+    ['D','D','H','N','O','T'],
+    ['D','H','H','L','O','R'],
+    ['D','H','H','N','O','W'],
+    ['D','H','L','N','O','R'],
+    ['E','H','I','L','R','S'],
+    ['E','I','I','L','S','T'],
+    ['E','I','L','P','S','T'],
+    ['E','I','O','E','I','O'],
+    ['E','M','T','T','T','O'],
+    ['E','N','S','S','S','U'],
+    ['G','O','R','R','V','W'],
+    ['H','I','R','S','T','V'],
+    ['H','O','P','R','S','T'],
+    ['I','P','R','S','Y','Y'],
+    ['J','K','Qu','W','X','Z'],
+    ['N','O','O','T','U','W'],
+    ['O','O','O','T','T','U']
+]
+
+# The dice set of every supported board size
+DICE = {4: LETTERS, 5: BIG_LETTERS, 6: SUPER_BIG_LETTERS}
+BOARD_SIZE = 4
+
+# Every face gets a one byte code, so a batch of boards can be stored as a
+# single compact bytes object of size ** 2 codes per board
+FACES = sorted({face for dice in DICE.values() for die in dice
+                for face in die})
+FACE_CODES = {face: code for code, face in enumerate(FACES)}
+DICE_CODES = {size: [bytes(FACE_CODES[face] for face in die) for die in dice]
+              for size, dice in DICE.items()}
+
+
+def randomize_board(rng=random, size=BOARD_SIZE, dice=None):
+    """
+    returns a size x size board as a list of rows. the dice are shuffled into
+    random cells and rolled with rng, pass a random.Random to replay a board.
+    dice maps board sizes to dice sets, for playing with other letters
+    """
+    if dice is None:
+        codes = roll_board(rng, size)
+        return decode_board(codes, size=size)
+    rolled = [die[rng.randrange(len(die))]
+              for die in rng.sample(dice[size], size ** 2)]
+    return [rolled[i:i + size] for i in range(0, size ** 2, size)]
+
+
+def roll_board(rng=random, size=BOARD_SIZE):
+    """
+    returns the face codes of a random board, row after row
+    """
+    dice = rng.sample(DICE_CODES[size], size ** 2)
+    return bytes([die[rng.randrange(len(die))] for die in dice])
+
+
+def generate_boards(count, seed=None, size=BOARD_SIZE):
+    """
+    returns count boards packed into one bytes object, size ** 2 face codes
+    per board. the same seed always gives the same boards
+    """
+    rng = random.Random(seed)
+    return b''.join([roll_board(rng, size) for _ in range(count)])
+
+
+def encode_board(board):
+    return bytes(FACE_CODES[face] for row in board for face in row)
+
+
+def decode_board(codes, index=0, size=BOARD_SIZE):
+    """
+    returns board number index out of packed face codes as a list of rows
+    """
+    cells = size ** 2
+    start = index * cells
+    return [[FACES[code] for code in codes[i:i + size]]
+            for i in range(start, start + cells, size)]
+
+
+def iter_boards(codes, size=BOARD_SIZE):
+    """
+    yields every board out of packed face codes as a list of rows
+    """
+    for index in range(len(codes) // size ** 2):
+        yield decode_board(codes, index, size)
@@ -0,0 +1,181 @@
+#############################################################
+# FILE: boggle_client.py
+# AUTHORS: 1. Amir Harel
+#          2. Nadav Porat
+# EXERCISE: Exercise 12
+# DESCRIPTION: Client for the multiplayer server, and a load test that
+#              plays many scripted clients against it at once
+#############################################################
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+
+from boggle_server import HOST, PORT, BoggleServer, encode
+from boggle_solver import solve_board
+from lexicon_registry import DEFAULT_LEXICON, REGISTRY
+
+'''Magic Variables'''
+# Words a scripted client sends that are never on the board
+WRONG_WORDS = ['QZX', 'XYZZY', 'AAAA']
+# Fraction of a scripted client's submissions that are wrong words
+WRONG_RATE = 0.1
+# Fraction of a scripted client's submissions sent with their path
+PATH_RATE = 0.5
+SUMMARY = ('{} clients in {} rooms sent {} words in {:.2f}s ({:.0f} words/sec)'
+           ', latency p50 {:.2f}ms p99 {:.2f}ms max {:.2f}ms')
+
+
+class BoggleClient:
+    """
+    one connection to the server. results come back in the order words
+    were sent, and the latest board and scores are kept as they arrive
+    """
+
+    def __init__(self):
+        self.__reader = None
+        self.__writer = None
+        self.__results = asyncio.Queue()
+        self.__board = asyncio.Queue()  # board messages, one per round
+        self.__scores = {}
+        self.__listener = None
+
+    async def connect(self, host=HOST, port=PORT):
+        self.__reader, self.__writer = await asyncio.open_connection(host,
+                                                                     port)
+        self.__listener = asyncio.create_task(self.__listen())
+        return self
+
+    async def __listen(self):
+        while True:
+            line = await self.__reader.readline()
+            if not line:
+                break
+            message = json.loads(line)
+            kind = message['type']
+            if kind == 'result' or kind == 'error':
+                self.__results.put_nowait(message)
+            elif kind == 'board':
+                self.__board.put_nowait(message)
+            elif kind == 'scores' or kind == 'round_end':
+                self.__scores = message['scores']
+
+    def get_scores(self):
+        return dict(self.__scores)
+
+    async def join(self, room, player):
+        """
+        joins room as player and returns the room's board message
+        """
+        self.__writer.write(encode({'type': 'join', 'room': room,
+                                    'player': player}))
+        await self.__writer.drain()
+        return await self.__board.get()
+
+    async def submit(self, word, path=None):
+        """
+        sends a word, and the path that spells it if given, and returns the
+        server's result for it
+        """
+        message = {'type': 'word', 'word': word}
+        if path is not None:
+            message['path'] = path
+        self.__writer.write(encode(message))
+        await self.__writer.drain()
+        return await self.__results.get()
+
+    async def close(self):
+        if self.__writer is None:
+            return
+        self.__writer.write(encode({'type': 'leave'}))
+        self.__writer.close()
+        await self.__writer.wait_closed()
+        self.__listener.cancel()
+
+
+async def scripted_player(host, port, room, player, words, lexicon,
+                          latencies):
+    """
+    joins room, solves the board it gets and sends up to words of its
+    answers mixed with some wrong words, half of them with their paths,
+    recording every round trip
+    """
+    client = await BoggleClient().connect(host, port)
+    try:
+        board = (await client.join(room, player))['board']
+        solution = solve_board(board, lexicon)
+        answers = list(solution)
+        rng = random.Random(player)
+        rng.shuffle(answers)
+        for word in answers[:words]:
+            path = solution[word] if rng.random() < PATH_RATE else None
+            if rng.random() < WRONG_RATE:
+                word = rng.choice(WRONG_WORDS)
+            start = time.perf_counter()
+            await client.submit(word, path)
+            latencies.append(time.perf_counter() - start)
+    finally:
+        await client.close()
+
+
+async def load_test(host, port, clients, rooms, words, lexicon, serve=False,
+                    round_time=60):
+    """
+    plays clients scripted players spread over rooms against the server at
+    host:port, or against a server started in this process if serve is
+    set. returns the round trip latency of every word sent, in seconds
+    """
+    server = None
+    if serve:
+        server = BoggleServer(lexicon, round_time)
+        await server.start(host, 0)
+        port = server.get_port()
+    latencies = []
+    await asyncio.gather(*(
+        scripted_player(host, port, f'room{i % rooms}', f'player{i}', words,
+                        lexicon, latencies)
+        for i in range(clients)))
+    return latencies
+
+
+def percentile(values, fraction):
+    return values[min(len(values) - 1, int(len(values) * fraction))]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description='Load test the multiplayer boggle server')
+    parser.add_argument('--host', default=HOST)
+    parser.add_argument('--port', type=int, default=PORT)
+    parser.add_argument('-c', '--clients', type=int, default=100,
+                        help='number of simultaneous clients')
+    parser.add_argument('-r', '--rooms', type=int, default=10,
+                        help='number of rooms the clients are spread over')
+    parser.add_argument('-w', '--words', type=int, default=50,
+                        help='words each client sends')
+    parser.add_argument('--serve', action='store_true',
+                        help='start a server in this process to test against')
+    parser.add_argument('--lexicon', default=DEFAULT_LEXICON,
+                        choices=REGISTRY.get_names(), help='language')
+    args = parser.parse_args(argv)
+
+    lexicon = REGISTRY.get_lexicon(args.lexicon)
+    start = time.perf_counter()
+    latencies = asyncio.run(load_test(args.host, args.port, args.clients,
+                                      args.rooms, args.words, lexicon,
+                                      args.serve))
+    seconds = time.perf_counter() - start
+    latencies.sort()
+    latencies = latencies or [0.0]
+    print(SUMMARY.format(args.clients, args.rooms, len(latencies), seconds,
+                         len(latencies) / seconds,
+                         percentile(latencies, 0.5) * 1000,
+                         percentile(latencies, 0.99) * 1000,
+                         latencies[-1] * 1000), file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
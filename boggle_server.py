@@ -0,0 +1,297 @@
+#############################################################
+# FILE: boggle_server.py
+# AUTHORS: 1. Amir Harel
+#          2. Nadav Porat
+# EXERCISE: Exercise 12
+# DESCRIPTION: Multiplayer server - many rooms, every room plays one shared
+#              board, messages are JSON lines over TCP
+#############################################################
+
+import argparse
+import asyncio
+import json
+
+from boggle_board_randomizer import BOARD_SIZE, DICE, randomize_board
+from boggle_solver import max_score, score_word, solve_board
+from game_engine import FoundWords
+from lexicon_registry import DEFAULT_LEXICON, REGISTRY
+from word_validator import NOT_A_WORD, NOT_ON_BOARD, VALID, BoardValidator
+
+'''Magic Variables'''
+HOST = '127.0.0.1'
+PORT = 8765
+ROUND_TIME = 180  # seconds
+# Scores are broadcast at most this often (seconds), and only if changed
+SCORE_INTERVAL = 0.5
+# Longest line a client may send
+MAX_LINE = 4096
+
+# Reasons sent back for a submitted word, besides the ones of word_validator
+ACCEPTED = 'accepted'
+DUPLICATE = 'duplicate'
+
+
+def encode(message):
+    return (json.dumps(message) + '\n').encode()
+
+
+def make_round(lexicon, size, dice):
+    """
+    rolls a board and returns it with its answer key and its validator.
+    run in an executor, so solving a board never stops the other rooms
+    """
+    board = randomize_board(size=size, dice=dice)
+    return board, solve_board(board, lexicon), BoardValidator(board, lexicon)
+
+
+class Player:
+    """
+    a connected player and the words they found in the current round
+    """
+
+    def __init__(self, name, writer):
+        self.name = name
+        self.writer = writer
+        self.found = FoundWords()
+
+    def send(self, data):
+        # data is already encoded, so a broadcast encodes only once
+        if not self.writer.is_closing():
+            self.writer.write(data)
+
+
+class Room:
+    """
+    a group of players that play the same board at the same time
+    """
+
+    def __init__(self, name, lexicon, size=BOARD_SIZE, dice=None):
+        self.__name = name
+        self.__lexicon = lexicon
+        self.__size = size
+        self.__dice = dice
+        self.__players = set()
+        self.__board = None
+        self.__solution = {}  # word -> path, every word on the board
+        self.__validator = None
+        self.__ends_at = 0.0  # loop time the round ends at
+        self.__ready = asyncio.Event()  # set while a round is played
+        self.__scores_changed = False
+
+    def get_name(self):
+        return self.__name
+
+    def is_empty(self):
+        return not self.__players
+
+    def get_ends_at(self):
+        return self.__ends_at
+
+    async def new_round(self, round_time):
+        """
+        starts a round of round_time seconds on a new board. the board is
+        solved in an executor, words sent meanwhile wait for it
+        """
+        self.__ready.clear()
+        loop = asyncio.get_running_loop()
+        self.__board, self.__solution, self.__validator = \
+            await loop.run_in_executor(None, make_round, self.__lexicon,
+                                       self.__size, self.__dice)
+        self.__ends_at = loop.time() + round_time
+        for player in self.__players:
+            player.found = FoundWords()
+        self.__ready.set()
+        self.broadcast(self.get_board_message())
+
+    async def wait_ready(self):
+        # waits until the board of the round is solved
+        await self.__ready.wait()
+
+    def get_board_message(self):
+        loop_time = asyncio.get_running_loop().time()
+        return {'type': 'board', 'room': self.__name, 'board': self.__board,
+                'ends_in': max(0.0, self.__ends_at - loop_time)}
+
+    def join(self, player):
+        self.__players.add(player)
+        self.__scores_changed = True
+        if self.__ready.is_set():  # otherwise it's sent when it's solved
+            player.send(encode(self.get_board_message()))
+
+    def leave(self, player):
+        self.__players.discard(player)
+        self.__scores_changed = True
+
+    def submit(self, player, word, path=None):
+        """
+        checks a word submitted by player and scores it. a word sent with
+        the path the player pressed must be spelled by that path, otherwise
+        it is looked up in the answer key made when the round started
+        """
+        word = word.upper()
+        points = 0
+        if path is not None:
+            try:
+                reason = self.__validator.check_path(word, path)
+            except (TypeError, ValueError):  # whatever the client sent
+                return {'type': 'error', 'error': 'bad path'}
+        elif word in self.__solution:
+            reason = VALID
+        elif word in self.__lexicon:
+            reason = NOT_ON_BOARD
+        else:
+            reason = NOT_A_WORD
+        if reason == VALID:
+            if word in player.found:
+                reason = DUPLICATE
+            else:
+                points = score_word(word)
+                player.found.add(word, points)
+                self.__scores_changed = True
+                reason = ACCEPTED
+        return {'type': 'result', 'word': word, 'points': points,
+                'reason': reason, 'score': player.found.get_score()}
+
+    def get_scores(self):
+        return {player.name: player.found.get_score()
+                for player in self.__players}
+
+    def broadcast(self, message):
+        data = encode(message)
+        for player in self.__players:
+            player.send(data)
+
+    def broadcast_scores(self):
+        if self.__scores_changed:
+            self.__scores_changed = False
+            self.broadcast({'type': 'scores', 'scores': self.get_scores()})
+
+    def end_round(self):
+        self.broadcast({'type': 'round_end', 'scores': self.get_scores(),
+                        'max_score': max_score(self.__solution),
+                        'words': len(self.__solution)})
+
+
+class BoggleServer:
+    """
+    hosts the rooms. every room runs its rounds in its own task, every
+    connection is handled by its own task, and all of them share a single
+    lexicon
+    """
+
+    def __init__(self, lexicon, round_time=ROUND_TIME, size=BOARD_SIZE,
+                 dice=None):
+        self.__lexicon = lexicon
+        self.__round_time = round_time
+        self.__size = size
+        self.__dice = dice
+        self.__rooms = {}  # name -> Room
+        self.__server = None
+
+    def get_rooms(self):
+        return dict(self.__rooms)
+
+    async def start(self, host=HOST, port=PORT):
+        self.__server = await asyncio.start_server(self.handle, host, port,
+                                                   limit=MAX_LINE)
+        return self.__server
+
+    async def serve_forever(self, host=HOST, port=PORT):
+        server = await self.start(host, port)
+        async with server:
+            await server.serve_forever()
+
+    def get_port(self):
+        return self.__server.sockets[0].getsockname()[1]
+
+    async def run_room(self, room):
+        """
+        plays rounds in room until every player left
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            await room.new_round(self.__round_time)
+            ends_at = room.get_ends_at()
+            while loop.time() < ends_at and not room.is_empty():
+                await asyncio.sleep(min(SCORE_INTERVAL,
+                                        max(0.0, ends_at - loop.time())))
+                room.broadcast_scores()
+            room.end_round()
+            if room.is_empty():
+                break
+        del self.__rooms[room.get_name()]
+
+    def join(self, room_name, player):
+        room = self.__rooms.get(room_name)
+        if room is None:
+            room = Room(room_name, self.__lexicon, self.__size, self.__dice)
+            self.__rooms[room_name] = room
+            asyncio.create_task(self.run_room(room))
+        room.join(player)
+        return room
+
+    async def handle(self, reader, writer):
+        player = None
+        room = None
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except (asyncio.LimitOverrunError, ValueError):
+                    break  # line too long
+                if not line:
+                    break
+                try:
+                    message = json.loads(line)
+                    kind = message['type']
+                except (ValueError, KeyError, TypeError):
+                    writer.write(encode({'type': 'error',
+                                         'error': 'bad message'}))
+                    continue
+                if kind == 'join' and room is None:
+                    player = Player(str(message.get('player', '')), writer)
+                    room = self.join(str(message.get('room', '')), player)
+                elif kind == 'word' and room is not None:
+                    # a word sent with the join is checked against the
+                    # room's first board
+                    await room.wait_ready()
+                    writer.write(encode(room.submit(
+                        player, str(message.get('word', '')),
+                        message.get('path'))))
+                elif kind == 'leave':
+                    break
+                else:
+                    writer.write(encode({'type': 'error',
+                                         'error': f'unexpected {kind}'}))
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            if room is not None:
+                room.leave(player)
+            writer.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Multiplayer boggle server')
+    parser.add_argument('--host', default=HOST)
+    parser.add_argument('--port', type=int, default=PORT)
+    parser.add_argument('--round-time', type=float, default=ROUND_TIME,
+                        help='length of a round in seconds')
+    parser.add_argument('--size', type=int, default=BOARD_SIZE,
+                        choices=sorted(DICE), help='board size')
+    parser.add_argument('--lexicon', default=DEFAULT_LEXICON,
+                        choices=REGISTRY.get_names(), help='language')
+    args = parser.parse_args(argv)
+
+    server = BoggleServer(REGISTRY.get_lexicon(args.lexicon),
+                          args.round_time, args.size,
+                          REGISTRY.get_dice(args.lexicon))
+    try:
+        asyncio.run(server.serve_forever(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
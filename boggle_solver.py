@@ -0,0 +1,65 @@
+#############################################################
+# FILE: boggle_solver.py
+# AUTHORS: 1. Amir Harel
+#          2. Nadav Porat
+# EXERCISE: Exercise 12
+# DESCRIPTION: Finds every word that can be formed on a boggle board
+#############################################################
+
+from board_layout import neighbour_table
+from instrumentation import timed
+
+'''Magic Variables'''
+# shortest word that counts in the game
+MIN_WORD_LENGTH = 2
+
+
+def score_word(word):
+    """
+    returns the score a player gets for finding word
+    """
+    return len(word) ** 2
+
+
+@timed('solver.solve_board')
+def solve_board(board, lexicon):
+    """
+    board is a list of rows as returned by randomize_board, lexicon is a
+    Lexicon or a CompiledLexicon. returns a dictionary from every word that
+    can be found on the board to one path (list of locations) that forms it
+    """
+    faces = {(i, j): face.upper()
+             for i, row in enumerate(board)
+             for j, face in enumerate(row)}
+    neighbours = neighbour_table(len(board), len(board[0]))
+    found = {}
+    get_child, is_word = lexicon.get_child, lexicon.is_word
+
+    def visit(location, node, word, path):
+        # walks every letter of the face, so 'Qu' is followed as Q then U
+        for letter in faces[location]:
+            node = get_child(node, letter)
+            if node is None:
+                return  # no word starts with this prefix
+        word += faces[location]
+        path.append(location)
+        if is_word(node) and len(word) >= MIN_WORD_LENGTH \
+                and word not in found:
+            found[word] = list(path)
+        for neighbour in neighbours[location]:
+            if neighbour not in path:
+                visit(neighbour, node, word, path)
+        path.pop()
+
+    root = lexicon.get_root()
+    for location in faces:
+        visit(location, root, '', [])
+    return found
+
+
+def max_score(words):
+    """
+    returns the highest score a player can get on a board, given the words
+    found on it by solve_board
+    """
+    return sum(score_word(word) for word in words)
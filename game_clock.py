@@ -0,0 +1,63 @@
+#############################################################
+# FILE: game_clock.py
+# AUTHORS: 1. Amir Harel
+#          2. Nadav Porat
+# EXERCISE: Exercise 12
+# DESCRIPTION: Countdown clock measured against a fixed end instant
+#############################################################
+
+import math
+import time
+
+
+class GameClock:
+    """
+    counts down duration seconds. the remaining time is always computed from
+    the instant the clock ends, so late callbacks never make it drift
+    """
+
+    def __init__(self, duration, now=time.monotonic):
+        self.__duration = duration
+        self.__now = now
+        self.__start = None
+        self.__stopped_at = None
+
+    def start(self):
+        self.__start = self.__now()
+        self.__stopped_at = None
+        return self
+
+    def stop(self):
+        if self.__stopped_at is None:
+            self.__stopped_at = self.__now()
+
+    def is_running(self):
+        return self.__start is not None and self.__stopped_at is None \
+            and not self.is_over()
+
+    def get_elapsed(self):
+        if self.__start is None:
+            return 0.0
+        end = self.__now() if self.__stopped_at is None else self.__stopped_at
+        return min(end - self.__start, self.__duration)
+
+    def get_remaining(self):
+        return self.__duration - self.get_elapsed()
+
+    def is_over(self):
+        return self.get_remaining() <= 0
+
+    def get_display_seconds(self):
+        """
+        returns the remaining time rounded up to whole seconds, the value
+        shown to the player
+        """
+        return math.ceil(self.get_remaining())
+
+    def get_next_change(self):
+        """
+        returns the number of milliseconds until the displayed value changes
+        """
+        remaining = self.get_remaining()
+        fraction = remaining - math.floor(remaining)
+        return max(1, math.ceil((fraction or 1) * 1000))
@@ -0,0 +1,311 @@
+#############################################################
+# FILE: game_engine.py
+# AUTHORS: 1. Amir Harel
+#          2. Nadav Porat
+# EXERCISE: Exercise 12
+# DESCRIPTION: The rules of a single game - pressing tiles, checking words
+#              and scoring - without any dependency on the screen
+#############################################################
+
+from board_layout import PressPath
+from boggle_solver import max_score, score_word, solve_board
+from instrumentation import PROFILER
+from typed_paths import TypedPaths
+
+'''Magic Variables'''
+# Words that get their own reaction
+RANDOM_WORDS = ['AA', 'AAH', 'AAL', 'AAS', 'AB', 'ABA', 'AX']
+# Longest words that get the 'basic' and 'impressive' reactions
+BASIC_LENGTH = 3
+IMPRESSIVE_LENGTH = 8
+
+
+class FoundWords:
+    """
+    the words the player found - a set for O(1) lookups and an append-only
+    log that keeps the order they were found in. the score is updated with
+    every word instead of being recomputed
+    """
+
+    def __init__(self):
+        self.__words = set()
+        self.__log = []  # (word, points) in the order they were found
+        self.__score = 0
+
+    def __contains__(self, word):
+        return word in self.__words
+
+    def __len__(self):
+        return len(self.__log)
+
+    def __iter__(self):
+        return (word for word, points in self.__log)
+
+    def add(self, word, points):
+        """
+        adds word to the found words, returns False if it was already found
+        """
+        if word in self.__words:
+            return False
+        self.__words.add(word)
+        self.__log.append((word, points))
+        self.__score += points
+        return True
+
+    def get_score(self):
+        return self.__score
+
+    def get_since(self, index):
+        """
+        returns the words found after the first index words, so a view can
+        show only the new ones
+        """
+        return [word for word, points in self.__log[index:]]
+
+
+class RoundReport:
+    """
+    the end of round summary - every word on the board grouped by length,
+    which of them the player found and how much of the board they covered
+    """
+
+    def __init__(self, solution, found, score, max_score):
+        self.__by_length = {}  # length -> sorted words of that length
+        for word in sorted(solution, key=lambda word: (len(word), word)):
+            self.__by_length.setdefault(len(word), []).append(word)
+        self.__found = found
+        self.__total = len(solution)
+        self.__score = score
+        self.__max_score = max_score
+
+    def get_by_length(self):
+        return self.__by_length
+
+    def get_missed_by_length(self):
+        """
+        returns length -> the words of that length the player missed
+        """
+        missed = {}
+        for length, words in self.__by_length.items():
+            words = [word for word in words if word not in self.__found]
+            if words:
+                missed[length] = words
+        return missed
+
+    def get_total(self):
+        return self.__total
+
+    def get_found_count(self):
+        return len(self.__found)
+
+    def get_coverage(self):
+        """
+        returns the percentage of the board's words the player found
+        """
+        if not self.__total:
+            return 100.0
+        return 100.0 * len(self.__found) / self.__total
+
+    def get_score(self):
+        return self.__score
+
+    def get_max_score(self):
+        return self.__max_score
+
+
+class GameEngine:
+    """
+    a single game on a single board. the screen only forwards the player's
+    actions here and displays the result, so a game can be played, tested
+    and profiled without a display
+    """
+
+    def __init__(self, board, lexicon, solution=None, log=None,
+                 best_score=None):
+        # board is a list of rows, as returned by randomize_board. solution
+        # is the board's answer key from solve_board and best_score its
+        # max_score, if already known. log is a ReplayWriter every action of
+        # the player is written to
+        self.__log = log
+        self.__solution = solution
+        self.__max_score = best_score
+        self.__board = [[face.upper() for face in row] for row in board]
+        self.__faces = [list(row) for row in board]  # as shown on the tiles
+        self.__lexicon = lexicon
+        self.__path = PressPath(len(board), len(board[0]))
+        self.__typed = TypedPaths(board, lexicon)  # The word typed, if any
+        self.__word = ''  # The word the player is currently forming
+        self.__found = FoundWords()  # Words found by the player and score
+
+    '''Getters'''
+
+    def get_board(self):
+        return self.__faces
+
+    def get_size(self):
+        return len(self.__board), len(self.__board[0])
+
+    def get_word(self):
+        return self.__word
+
+    def get_path(self):
+        """
+        returns the tiles of the forming word - the pressed tiles, or a path
+        that spells the typed word (None if there is none)
+        """
+        if len(self.__typed):
+            return self.__typed.get_path()
+        return self.__path.get_path()
+
+    def is_typing(self):
+        return bool(len(self.__typed))
+
+    def get_score(self):
+        return self.__found.get_score()
+
+    def get_bank(self):
+        return list(self.__found)
+
+    def get_found(self):
+        return self.__found
+
+    def get_lexicon(self):
+        return self.__lexicon
+
+    def get_solution(self):
+        """
+        returns every word on the board with its path. the board is solved
+        only once, and not at all if the solution was given
+        """
+        if self.__solution is None:
+            self.__solution = solve_board(self.__faces, self.__lexicon)
+        return self.__solution
+
+    def get_max_score(self):
+        if self.__max_score is None:
+            self.__max_score = max_score(self.get_solution())
+        return self.__max_score
+
+    def get_report(self):
+        return RoundReport(self.get_solution(), self.__found,
+                           self.get_score(), self.get_max_score())
+
+    def get_hint(self):
+        """
+        returns the path of the shortest word the player didn't find yet,
+        or None if every word was found
+        """
+        missed = [word for word in self.get_solution()
+                  if word not in self.__found]
+        if not missed:
+            return None
+        word = min(missed, key=lambda word: (len(word), word))
+        return list(self.get_solution()[word])
+
+    def get_enabled(self):
+        """
+        returns a bitmask of the tiles that can be pressed now
+        """
+        return self.__path.get_enabled()
+
+    def get_location(self, index):
+        return self.__path.get_location(index)
+
+    '''Gameplay'''
+
+    def press(self, location):
+        """
+        presses the tile at location. pressing the last pressed tile again
+        undoes it. returns False if the tile can't be pressed now
+        """
+        if not self.get_enabled() >> self.__path.get_index(location) & 1:
+            return False
+        if len(self.__typed):  # pressing a tile starts over from the tile
+            self.__clear()
+        if self.__log is not None:
+            self.__log.press(location)
+        if self.__path.is_pressed(location):
+            self.__path.pop()
+            self.__word = self.__word[:-len(self.__face(location))]
+        else:
+            self.__path.press(location)
+            self.__word += self.__face(location)
+        return True
+
+    def type_letter(self, letter):
+        """
+        adds a typed letter to the forming word. returns whether a path on
+        the board spells the typed word
+        """
+        if len(self.__path):  # typing starts over from the keyboard
+            self.__path.clear()
+            self.__word = ''
+        if self.__log is not None:
+            self.__log.type_letter(letter)
+        self.__typed.push(letter)
+        self.__word = self.__typed.get_word()
+        return self.__typed.get_path() is not None
+
+    def erase_letter(self):
+        """
+        erases the last typed letter, or unpresses the last pressed tile if
+        the word was formed with the tiles
+        """
+        if self.__log is not None:
+            self.__log.erase_letter()
+        if len(self.__typed):
+            self.__typed.pop()
+            self.__word = self.__typed.get_word()
+        elif len(self.__path):
+            location = self.__path.pop()
+            self.__word = self.__word[:-len(self.__face(location))]
+
+    def clear_word(self):
+        if self.__log is not None:
+            self.__log.clear_word()
+        self.__clear()
+
+    def check_word(self):
+        """
+        checks the forming word, scores it if it is new and clears it.
+        returns the reaction key for the word and the points it earned
+        """
+        word = self.__word
+        if len(self.__typed) and self.__typed.get_path() is None:
+            key = 'wrong'  # a typed word must be on the board too
+        else:
+            key = self.reaction_key(word)
+        points = 0
+        if key not in ('wrong', 'recycle'):
+            points = score_word(word)
+            self.__found.add(word, points)
+        if self.__log is not None:
+            self.__log.check_word(word, key, points)
+        self.__clear()
+        return key, points
+
+    def reaction_key(self, word):
+        """
+        returns appropriate key for the reaction to word
+        """
+        if word in self.__found:  # found words are always in the lexicon
+            return 'recycle'
+        with PROFILER.measure('lexicon.lookup'):
+            known = word in self.__lexicon
+        if not known:
+            return 'wrong'
+        if word in RANDOM_WORDS:
+            return 'random'
+        if len(word) <= BASIC_LENGTH:
+            return 'basic'
+        if len(word) <= IMPRESSIVE_LENGTH:
+            return 'impressive'
+        return 'unknown'
+
+    def __clear(self):
+        self.__path.clear()
+        self.__typed.clear()
+        self.__word = ''
+
+    def __face(self, location):
+        return self.__board[location[0]][location[1]]
@@ -0,0 +1,236 @@
+#############################################################
+# FILE: game_history.py
+# AUTHORS: 1. Amir Harel
+#          2. Nadav Porat
+# EXERCISE: Exercise 12
+# DESCRIPTION: Every finished game kept in a SQLite database, for the
+#              leaderboard and each player's history
+#############################################################
+
+import argparse
+import atexit
+import contextlib
+import json
+import os
+import queue
+import sqlite3
+import threading
+import time
+
+'''Magic Variables'''
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_PATH = os.path.join(BASE_DIR, 'boggle_history.sqlite3')
+# Used when the database can't be made next to the game, games are then
+# kept only until the game exits
+MEMORY_PATH = 'file:boggle_history?mode=memory&cache=shared'
+# Most games written in one transaction
+BATCH_SIZE = 500
+# How many entries the leaderboard shows
+TOP_SIZE = 10
+SCHEMA = [
+    'PRAGMA journal_mode=WAL',  # readers never wait for the writer
+    'CREATE TABLE IF NOT EXISTS games ('
+    ' id INTEGER PRIMARY KEY,'
+    ' player TEXT NOT NULL,'
+    ' board TEXT NOT NULL,'  # JSON list of rows
+    ' words TEXT NOT NULL,'  # JSON list of the words found
+    ' score INTEGER NOT NULL,'
+    ' duration REAL NOT NULL,'  # seconds played
+    ' played_at REAL NOT NULL)',  # unix time the game ended
+    # every query below reads only the first rows of one of these
+    'CREATE INDEX IF NOT EXISTS games_by_score ON games (score DESC, id)',
+    'CREATE INDEX IF NOT EXISTS games_by_player_score '
+    'ON games (player, score DESC, id)',
+    'CREATE INDEX IF NOT EXISTS games_by_player_time '
+    'ON games (player, played_at DESC)'
+]
+COLUMNS = 'id, player, board, words, score, duration, played_at'
+# the id is given by SQLite, so several games can share the database
+INSERT = 'INSERT INTO games (player, board, words, score, duration, ' \
+         'played_at) VALUES (?, ?, ?, ?, ?, ?)'
+
+
+def decode(row):
+    """
+    turns a row of the games table into (player, board, words, score,
+    duration, played_at)
+    """
+    return (row[1], json.loads(row[2]), json.loads(row[3])) + tuple(row[4:])
+
+
+class GameHistory:
+    """
+    the finished games. record() only queues a game, a background thread
+    writes queued games in batches so the screen never waits for the disk.
+    games not written yet are merged into every query, so they show up on
+    the leaderboard right away
+    """
+
+    def __init__(self, path=DEFAULT_PATH, batch_size=BATCH_SIZE):
+        self.__path = path
+        self.__batch_size = batch_size
+        try:
+            self.__reader = self.__connect()
+            self.__writer = self.__connect()
+        except (OSError, sqlite3.Error):  # can't write next to the game
+            self.__path = MEMORY_PATH
+            self.__reader = self.__connect()
+            self.__writer = self.__connect()
+        # a queued game is known by its place in the queue until SQLite
+        # gives it an id
+        self.__next_seq = 0
+        self.__pending = {}  # seq -> row of a game that wasn't written yet
+        # held while a batch is committed and while a query reads the table
+        # and the pending games, so no query sees a game twice or misses it
+        self.__lock = threading.RLock()
+        self.__queue = queue.Queue()
+        self.__thread = threading.Thread(target=self.__write, daemon=True)
+        self.__thread.start()
+        atexit.register(self.close)
+
+    def record(self, player, board, words, score, duration, played_at=None):
+        """
+        queues a finished game to be saved
+        """
+        if played_at is None:
+            played_at = time.time()
+        with self.__lock:
+            row = (self.__next_seq, player, json.dumps(board),
+                   json.dumps(list(words)), score, duration, played_at)
+            self.__next_seq += 1
+            self.__pending[row[0]] = row
+        self.__queue.put(row)
+
+    def __connect(self):
+        connection = sqlite3.connect(self.__path, check_same_thread=False,
+                                     uri=self.__path == MEMORY_PATH)
+        for statement in SCHEMA:
+            connection.execute(statement)
+        connection.commit()
+        return connection
+
+    def __write(self):
+        connection = self.__writer
+        # a database in memory can't be read while it's written to, one in a
+        # file can until the batch is committed
+        in_memory = self.__path == MEMORY_PATH
+        unsaved = []  # rows that failed to be written, tried again
+        stop = False
+        while not stop:
+            batch = [self.__queue.get()]
+            # everything queued meanwhile is written in the same transaction
+            while len(batch) < self.__batch_size:
+                try:
+                    batch.append(self.__queue.get_nowait())
+                except queue.Empty:
+                    break
+            if None in batch:  # close() was called
+                stop = True
+            rows = unsaved + [row for row in batch if row is not None]
+            try:
+                with self.__lock if in_memory else contextlib.nullcontext():
+                    # waits here, not in the lock, while another game writes
+                    connection.execute('BEGIN IMMEDIATE')
+                    connection.executemany(INSERT,
+                                           [row[1:] for row in rows])
+                    with self.__lock:
+                        connection.commit()
+                        for row in rows:
+                            del self.__pending[row[0]]
+                unsaved = []
+            except sqlite3.Error:  # e.g. another game kept the database busy
+                if connection.in_transaction:
+                    connection.rollback()
+                unsaved = rows  # still shown, written with the next batch
+            finally:  # flush() never waits for a batch that failed
+                for _ in batch:
+                    self.__queue.task_done()
+        connection.close()
+
+    def flush(self):
+        """
+        waits until every queued game was written, or failed to be
+        """
+        self.__queue.join()
+
+    def close(self):
+        if self.__thread.is_alive():
+            self.__queue.put(None)
+            self.__thread.join()
+
+    def __where(self, player):
+        if player is None:
+            return '', ()
+        return 'WHERE player = ?', (player,)
+
+    def __select(self, player, order, n):
+        """
+        returns the first n games by order from the table together with
+        every game not written yet, only player's if player is given
+        """
+        where, params = self.__where(player)
+        with self.__lock:
+            rows = self.__reader.execute(
+                f'SELECT {COLUMNS} FROM games {where} ORDER BY {order} '
+                f'LIMIT ?', params + (n,)).fetchall()
+            pending = [row for row in self.__pending.values()
+                       if player is None or row[1] == player]
+        return rows + pending
+
+    def top(self, n=TOP_SIZE, player=None):
+        """
+        returns the n highest scoring games, only player's if given
+        """
+        rows = self.__select(player, 'score DESC, id', n)
+        rows.sort(key=lambda row: -row[4])  # written games first on a tie
+        return [decode(row) for row in rows[:n]]
+
+    def history(self, player, n=TOP_SIZE):
+        """
+        returns player's last n games, the latest first
+        """
+        rows = self.__select(player, 'played_at DESC', n)
+        rows.sort(key=lambda row: -row[6])
+        return [decode(row) for row in rows[:n]]
+
+    def count(self, player=None):
+        """
+        returns the number of games recorded, only player's if given
+        """
+        where, params = self.__where(player)
+        with self.__lock:
+            count = self.__reader.execute(
+                f'SELECT COUNT(*) FROM games {where}', params).fetchone()[0]
+            return count + sum(player is None or row[1] == player
+                               for row in self.__pending.values())
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description='Show the leaderboard and the history of players')
+    parser.add_argument('--db', default=DEFAULT_PATH,
+                        help='game history database')
+    parser.add_argument('-n', '--top', type=int, default=TOP_SIZE,
+                        help='number of games to show')
+    parser.add_argument('-p', '--player', default=None,
+                        help='only show the games of this player')
+    parser.add_argument('--history', action='store_true',
+                        help="show the player's latest games instead")
+    args = parser.parse_args(argv)
+
+    history = GameHistory(args.db)
+    if args.history and args.player is not None:
+        games = history.history(args.player, args.top)
+    else:
+        games = history.top(args.top, args.player)
+    for player, board, words, score, duration, played_at in games:
+        print(json.dumps({'player': player, 'score': score,
+                          'words': len(words), 'duration': duration,
+                          'played_at': time.strftime(
+                              '%Y-%m-%d %H:%M', time.localtime(played_at)),
+                          'board': board}))
+    history.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+#############################################################
+# FILE: game_state.py
+# AUTHORS: 1. Amir Harel
+#          2. Nadav Porat
+# EXERCISE: Exercise 12
+# DESCRIPTION: The states of a game and the events that move between them
+#############################################################
+
+from instrumentation import PROFILER
+
+'''Magic Variables'''
+# Game states
+IDLE = 'idle'  # start screen, before the player pressed start
+RUNNING = 'running'  # countdown and clock are running
+ENDED = 'ended'  # end screen is shown
+
+# Dictionary from (state, event) to the state the event moves the game to,
+# an event that isn't listed for the current state is ignored
+TRANSITIONS = {
+    (IDLE, 'start'): RUNNING,
+    (IDLE, 'settings'): IDLE,
+    (IDLE, 'exit'): ENDED,
+    (RUNNING, 'tick'): RUNNING,
+    (RUNNING, 'end'): ENDED,
+    (RUNNING, 'exit'): ENDED,  # File > Exit during the countdown
+    (ENDED, 'retry'): IDLE,
+    (ENDED, 'settings'): ENDED,
+    (ENDED, 'exit'): ENDED
+}
+
+
+class GameStateMachine:
+    """
+    holds the state of the game and calls the callbacks registered for an
+    event when it happens, so nothing has to poll the screen for changes
+    """
+
+    def __init__(self):
+        self.__state = IDLE
+        self.__callbacks = {}  # event -> list of callbacks
+
+    def get_state(self):
+        return self.__state
+
+    def on(self, event, callback):
+        """
+        registers callback to be called with the event's arguments every
+        time event happens
+        """
+        self.__callbacks.setdefault(event, []).append(callback)
+
+    def fire(self, event, *args):
+        """
+        moves the game to the next state and calls the event's callbacks.
+        returns False if the event isn't allowed in the current state
+        """
+        PROFILER.count(f'event.{event}')
+        new_state = TRANSITIONS.get((self.__state, event))
+        if new_state is None:
+            return False
+        self.__state = new_state
+        for callback in self.__callbacks.get(event, []):
+            callback(*args)
+        return True
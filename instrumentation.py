@@ -0,0 +1,144 @@
+#############################################################
+# FILE: instrumentation.py
+# AUTHORS: 1. Amir Harel
+#          2. Nadav Porat
+# EXERCISE: Exercise 12
+# DESCRIPTION: Optional latency histograms and call counts for the game's
+#              handlers, written to a JSON file at exit
+#############################################################
+
+import atexit
+import bisect
+import contextlib
+import functools
+import json
+import os
+import threading
+import time
+
+'''Magic Variables'''
+# Set to a file path (or to 1 for DEFAULT_OUTPUT) to turn instrumentation on
+ENV_VAR = 'BOGGLE_PROFILE'
+DEFAULT_OUTPUT = 'boggle_profile.json'
+# Upper bounds of the histogram buckets, in microseconds. the last bucket
+# holds everything slower
+BUCKETS = [10, 50, 100, 500, 1000, 5000, 10000, 50000, 100000, 500000,
+           1000000]
+
+
+class Histogram:
+    """
+    latency distribution of a single handler
+    """
+
+    def __init__(self):
+        self.__buckets = [0] * (len(BUCKETS) + 1)
+        self.__count = 0
+        self.__total = 0.0
+        self.__max = 0.0
+
+    def add(self, seconds):
+        micros = seconds * 1e6
+        self.__buckets[bisect.bisect_left(BUCKETS, micros)] += 1
+        self.__count += 1
+        self.__total += micros
+        self.__max = max(self.__max, micros)
+
+    def to_dict(self):
+        labels = [f'<={bound}us' for bound in BUCKETS] \
+            + [f'>{BUCKETS[-1]}us']
+        return {
+            'count': self.__count,
+            'mean_us': self.__total / self.__count if self.__count else 0,
+            'max_us': self.__max,
+            'buckets': dict(zip(labels, self.__buckets))
+        }
+
+
+class Instrumentation:
+    """
+    collects latency histograms and counters. when disabled, timed()
+    returns functions unchanged and measure() does nothing, so the game
+    pays nothing for it
+    """
+
+    def __init__(self, output=None):
+        self.__output = output  # None means instrumentation is disabled
+        self.__histograms = {}
+        self.__counters = {}
+        self.__lock = threading.Lock()  # the lexicon and pool use threads
+        if output is not None:
+            atexit.register(self.dump)
+
+    def is_enabled(self):
+        return self.__output is not None
+
+    def record(self, name, seconds):
+        with self.__lock:
+            if name not in self.__histograms:
+                self.__histograms[name] = Histogram()
+            self.__histograms[name].add(seconds)
+
+    def count(self, name, amount=1):
+        if self.__output is None:
+            return
+        with self.__lock:
+            self.__counters[name] = self.__counters.get(name, 0) + amount
+
+    def measure(self, name):
+        """
+        returns a context manager that records how long its block took
+        """
+        if self.__output is None:
+            return contextlib.nullcontext()
+        return self.__measure(name)
+
+    @contextlib.contextmanager
+    def __measure(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+
+    def timed(self, name):
+        """
+        decorator that records the latency of every call of the function
+        """
+        def decorator(func):
+            if self.__output is None:
+                return func
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                start = time.perf_counter()
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    self.record(name, time.perf_counter() - start)
+            return wrapper
+        return decorator
+
+    def to_dict(self):
+        with self.__lock:
+            return {
+                'histograms': {name: histogram.to_dict() for name, histogram
+                               in sorted(self.__histograms.items())},
+                'counters': dict(sorted(self.__counters.items()))
+            }
+
+    def dump(self):
+        with open(self.__output, 'w') as file:
+            json.dump(self.to_dict(), file, indent=2)
+
+
+def output_from_env():
+    value = os.environ.get(ENV_VAR, '')
+    if value in ('', '0'):
+        return None
+    return DEFAULT_OUTPUT if value == '1' else value
+
+
+# The instrumentation used by the game
+PROFILER = Instrumentation(output_from_env())
+timed = PROFILER.timed
@@ -0,0 +1,454 @@
+#############################################################
+# FILE: lexicon.py
+# AUTHORS: 1. Amir Harel
+#          2. Nadav Porat
+# EXERCISE: Exercise 12
+# DESCRIPTION: Word index used to validate words in the game
+#############################################################
+
+import mmap
+import os
+import struct
+import sys
+import threading
+import tracemalloc
+import zlib
+from array import array
+
+'''Magic Variables'''
+# key that marks the end of a word inside a trie node
+WORD_END = '$'
+
+# Compiled lexicon file layout: a header, the alphabet, then three arrays
+# describing a minimal word graph (DAWG) - a letter bitmask per node, the
+# index of each node's first edge and the target node of every edge (edges
+# of a node are sorted by letter)
+COMPILED_SUFFIX = '.lex'
+MAGIC = b'BGLX'
+VERSION = 2
+# magic, version, byte order, alphabet length, word count, node count,
+# edge count, source size, source mtime, source checksum
+HEADER = struct.Struct('<4sBBHIIIQQI')
+BYTE_ORDERS = {'little': 0, 'big': 1}
+# bit of a node's mask that marks the node as the end of a word
+TERMINAL_BIT = 63
+MAX_ALPHABET = TERMINAL_BIT
+
+
+class Lexicon:
+    """
+    holds the game's dictionary - a set for word lookups and a prefix trie
+    for prefix lookups, so both cost O(len(word)) instead of O(dictionary)
+    """
+
+    def __init__(self, words):
+        self.__words = frozenset(words)
+        self.__trie = {}
+        for word in self.__words:
+            node = self.__trie
+            for letter in word:
+                node = node.setdefault(letter, {})
+            node[WORD_END] = True
+
+    def __contains__(self, word):
+        return word in self.__words
+
+    def __len__(self):
+        return len(self.__words)
+
+    def __iter__(self):
+        return iter(self.__words)
+
+    '''Trie Methods'''
+    # Every lexicon exposes its prefix tree through these methods, nodes are
+    # opaque values that are only passed back into the same lexicon
+
+    def get_root(self):
+        return self.__trie
+
+    def get_child(self, node, letter):
+        return node.get(letter)
+
+    def is_word(self, node):
+        return WORD_END in node
+
+    def get_node(self, prefix):
+        """
+        returns the trie node reached by prefix, or None if no word in the
+        lexicon starts with prefix
+        """
+        node = self.__trie
+        for letter in prefix:
+            node = node.get(letter)
+            if node is None:
+                return None
+        return node
+
+    def is_prefix(self, prefix):
+        return self.get_node(prefix) is not None
+
+    def iter_prefix(self, prefix=''):
+        """
+        yields every word that starts with prefix, in sorted order
+        """
+        node = self.get_node(prefix)
+        stack = [] if node is None else [(node, prefix)]
+        while stack:
+            node, word = stack.pop()
+            if WORD_END in node:
+                yield word
+            stack.extend((node[letter], word + letter)
+                         for letter in sorted(node, reverse=True)
+                         if letter != WORD_END)
+
+
+class CompiledLexicon:
+    """
+    a lexicon read from a compiled file. the file is memory mapped, so
+    opening it costs almost nothing and the pages are shared between every
+    process that uses the same file
+    """
+
+    def __init__(self, buffer):
+        (magic, version, order, alphabet_len, self.__count, nodes, edges,
+         *_) = HEADER.unpack_from(buffer)
+        if magic != MAGIC or version != VERSION \
+                or order != BYTE_ORDERS[sys.byteorder]:
+            raise ValueError('not a compatible compiled lexicon')
+        self.__buffer = buffer
+        start = HEADER.size
+        alphabet = bytes(buffer[start:start + alphabet_len]).decode('utf-8')
+        self.__alphabet = alphabet
+        # letter -> (bit in the node mask, mask of all the lower bits)
+        self.__bits = {letter: (1 << i, (1 << i) - 1)
+                       for i, letter in enumerate(alphabet)}
+        start += alphabet_len
+        start += -start % 8  # aligns the arrays for the casts below
+        view = memoryview(buffer)
+        self.__masks = view[start:start + nodes * 8].cast('Q')
+        start += nodes * 8
+        self.__first = view[start:start + nodes * 4].cast('I')
+        start += nodes * 4
+        self.__targets = view[start:start + edges * 4].cast('I')
+
+    def __contains__(self, word):
+        node = self.get_node(word)
+        return node is not None and self.is_word(node)
+
+    def __len__(self):
+        return self.__count
+
+    def __iter__(self):
+        return self.iter_prefix()
+
+    def get_footprint(self):
+        """
+        returns the size of the compiled lexicon in bytes. when it is memory
+        mapped these pages are shared by every process that maps the file
+        """
+        return len(self.__buffer)
+
+    '''Trie Methods'''
+
+    def get_root(self):
+        return 0
+
+    def get_child(self, node, letter):
+        bits = self.__bits.get(letter)
+        if bits is None:
+            return None
+        mask = self.__masks[node]
+        if not mask & bits[0]:
+            return None
+        # the rank of the letter among the node's letters is its edge
+        return self.__targets[self.__first[node]
+                              + (mask & bits[1]).bit_count()]
+
+    def is_word(self, node):
+        return self.__masks[node] >> TERMINAL_BIT
+
+    def get_node(self, prefix):
+        node = 0
+        for letter in prefix:
+            node = self.get_child(node, letter)
+            if node is None:
+                return None
+        return node
+
+    def is_prefix(self, prefix):
+        return self.get_node(prefix) is not None
+
+    def get_children(self, node):
+        """
+        returns a list of (letter, child node) of node, in letter order
+        """
+        mask, edge = self.__masks[node], self.__first[node]
+        children = []
+        for letter in self.__alphabet:
+            if mask & self.__bits[letter][0]:
+                children.append((letter, self.__targets[edge]))
+                edge += 1
+        return children
+
+    def iter_prefix(self, prefix=''):
+        """
+        yields every word that starts with prefix, in sorted order
+        """
+        node = self.get_node(prefix)
+        stack = [] if node is None else [(node, prefix)]
+        while stack:
+            node, word = stack.pop()
+            if self.is_word(node):
+                yield word
+            stack.extend((child, word + letter) for letter, child
+                         in reversed(self.get_children(node)))
+
+
+class BackgroundLexicon:
+    """
+    loads a lexicon in a background thread. it can be used right away, a
+    lookup made before the lexicon finished loading waits for it
+    """
+
+    def __init__(self, loader, *args):
+        self.__lexicon = None
+        self.__error = None
+        self.__ready = threading.Event()
+        self.__thread = threading.Thread(target=self.__load,
+                                         args=(loader, args), daemon=True)
+        self.__thread.start()
+
+    def __load(self, loader, args):
+        try:
+            self.__lexicon = loader(*args)
+        except Exception as error:  # raised again on the first lookup
+            self.__error = error
+        finally:
+            self.__ready.set()
+
+    def is_ready(self):
+        return self.__ready.is_set()
+
+    def get_lexicon(self):
+        """
+        returns the loaded lexicon, waiting for it if it isn't loaded yet
+        """
+        if self.__lexicon is None:
+            self.__ready.wait()
+            if self.__error is not None:
+                raise self.__error
+        return self.__lexicon
+
+    def __contains__(self, word):
+        return word in self.get_lexicon()
+
+    def __len__(self):
+        return len(self.get_lexicon())
+
+    def get_root(self):
+        return self.get_lexicon().get_root()
+
+    def get_child(self, node, letter):
+        return self.get_lexicon().get_child(node, letter)
+
+    def is_word(self, node):
+        return self.get_lexicon().is_word(node)
+
+    def get_node(self, prefix):
+        return self.get_lexicon().get_node(prefix)
+
+    def is_prefix(self, prefix):
+        return self.get_lexicon().is_prefix(prefix)
+
+    def iter_prefix(self, prefix=''):
+        return self.get_lexicon().iter_prefix(prefix)
+
+
+class _DawgNode:
+    """
+    a node of the word graph built by compile_lexicon
+    """
+    __slots__ = ('terminal', 'edges')
+
+    def __init__(self):
+        self.terminal = False
+        self.edges = {}  # letter -> _DawgNode, in sorted letter order
+
+    def get_signature(self):
+        # nodes with equal signatures accept the same suffixes, the children
+        # are already unique nodes so their ids identify them
+        return self.terminal, tuple((letter, id(child))
+                                    for letter, child in self.edges.items())
+
+
+def build_dawg(words):
+    """
+    returns the root of a minimal word graph (DAWG) holding words, which
+    must be sorted. words that end the same way share the nodes of their
+    common suffix, so the graph is much smaller than a trie
+    """
+    root = _DawgNode()
+    register = {}  # signature -> the unique node with that signature
+    unchecked = []  # (parent, letter, child) of the last word's new nodes
+
+    def minimize(down_to):
+        while len(unchecked) > down_to:
+            parent, letter, child = unchecked.pop()
+            signature = child.get_signature()
+            if signature in register:
+                parent.edges[letter] = register[signature]
+            else:
+                register[signature] = child
+
+    previous = ''
+    for word in words:
+        common = 0
+        while common < min(len(word), len(previous)) \
+                and word[common] == previous[common]:
+            common += 1
+        minimize(common)
+        node = unchecked[-1][2] if unchecked else root
+        for letter in word[common:]:
+            child = _DawgNode()
+            node.edges[letter] = child
+            unchecked.append((node, letter, child))
+            node = child
+        node.terminal = True
+        previous = word
+    minimize(0)
+    return root
+
+
+def compile_lexicon(words, source_stat=(0, 0, 0)):
+    """
+    returns the bytes of a compiled lexicon holding words. source_stat is
+    (size, mtime, checksum) of the file the words were read from
+    """
+    words = sorted(set(words))
+    alphabet = ''.join(sorted(set(''.join(words))))
+    if len(alphabet) > MAX_ALPHABET:
+        raise ValueError('too many letters for a compiled lexicon')
+    index = {letter: i for i, letter in enumerate(alphabet)}
+    root = build_dawg(words)
+
+    # numbers the unique nodes in breadth first order, the edges of every
+    # node are stored together in letter order
+    masks, first, targets = array('Q'), array('I'), array('I')
+    numbers = {id(root): 0}
+    queue = [root]
+    for node in queue:
+        mask = (1 << TERMINAL_BIT) if node.terminal else 0
+        first.append(len(targets))
+        for letter, child in node.edges.items():
+            mask |= 1 << index[letter]
+            if id(child) not in numbers:
+                numbers[id(child)] = len(queue)
+                queue.append(child)
+            targets.append(numbers[id(child)])
+        masks.append(mask)
+
+    encoded = alphabet.encode('utf-8')
+    header = HEADER.pack(MAGIC, VERSION, BYTE_ORDERS[sys.byteorder],
+                         len(encoded), len(words), len(masks),
+                         len(targets), *source_stat)
+    data = header + encoded
+    data += bytes(-len(data) % 8)
+    return data + masks.tobytes() + first.tobytes() + targets.tobytes()
+
+
+def read_words(path):
+    """
+    returns the list of words in a dictionary file, one word per line
+    """
+    with open(path, 'r') as file:
+        return file.read().split()
+
+
+def source_stat(path):
+    """
+    returns (size, mtime, checksum) of a dictionary file
+    """
+    stat = os.stat(path)
+    with open(path, 'rb') as file:
+        checksum = zlib.crc32(file.read())
+    return stat.st_size, stat.st_mtime_ns, checksum
+
+
+def is_compiled_current(source, compiled):
+    """
+    checks whether the compiled file was built from the current version of
+    source. size and mtime are checked first, the checksum is only computed
+    when the mtime changed (e.g. after a fresh checkout)
+    """
+    try:
+        with open(compiled, 'rb') as file:
+            header = file.read(HEADER.size)
+        stat = os.stat(source)
+    except OSError:
+        return False
+    if len(header) != HEADER.size:
+        return False
+    magic, version, order, *_, size, mtime, checksum = HEADER.unpack(header)
+    if magic != MAGIC or version != VERSION \
+            or order != BYTE_ORDERS[sys.byteorder] or size != stat.st_size:
+        return False
+    if mtime == stat.st_mtime_ns:
+        return True
+    return source_stat(source)[2] == checksum
+
+
+def load_lexicon(path):
+    """
+    returns a CompiledLexicon for the dictionary file at path. the compiled
+    file is kept next to the dictionary and rebuilt only when the dictionary
+    changes
+    """
+    compiled = os.path.splitext(path)[0] + COMPILED_SUFFIX
+    if not is_compiled_current(path, compiled):
+        data = compile_lexicon(read_words(path), source_stat(path))
+        temp = f'{compiled}.{os.getpid()}.tmp'
+        try:
+            with open(temp, 'wb') as file:
+                file.write(data)
+            os.replace(temp, compiled)  # other processes never see half
+        except OSError:  # can't write next to the dictionary
+            return CompiledLexicon(data)
+    with open(compiled, 'rb') as file:
+        buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    return CompiledLexicon(buffer)
+
+
+def measure_footprint(build, *args):
+    """
+    calls build(*args) and returns its result with the number of bytes of
+    memory the result still holds
+    """
+    tracemalloc.start()
+    try:
+        result = build(*args)
+        size = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    return result, size
+
+
+def footprint_report(path):
+    """
+    returns lines comparing the memory used by the ways to hold the
+    dictionary at path
+    """
+    words, list_size = measure_footprint(read_words, path)
+    del words
+    lexicon, set_size = measure_footprint(lambda: Lexicon(read_words(path)))
+    del lexicon
+    compiled = load_lexicon(path)
+    return [f'word list:         {list_size:>12,} bytes',
+            f'set and trie:      {set_size:>12,} bytes',
+            f'compiled (shared): {compiled.get_footprint():>12,} bytes',
+            f'words:             {len(compiled):>12,}']
+
+
+if __name__ == '__main__':
+    for line in footprint_report(sys.argv[1] if len(sys.argv) > 1
+                                 else 'boggle_dict.txt'):
+        print(line)
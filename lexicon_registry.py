@@ -0,0 +1,73 @@
+#############################################################
+# FILE: lexicon_registry.py
+# AUTHORS: 1. Amir Harel
+#          2. Nadav Porat
+# EXERCISE: Exercise 12
+# DESCRIPTION: The word lists and dice sets the game can be played with
+#############################################################
+
+import os
+import threading
+
+from boggle_board_randomizer import DICE
+from lexicon import load_lexicon
+
+'''Magic Variables'''
+# Relative dictionary paths are relative to the game's directory, not to
+# the directory the game was started from
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_LEXICON = 'English'
+
+
+class LexiconRegistry:
+    """
+    holds every registered lexicon by name, together with the dice set it is
+    played with. each lexicon is compiled and loaded once, the first time it
+    is asked for, and shared by every game that uses it
+    """
+
+    def __init__(self):
+        self.__entries = {}  # name -> (dictionary path, dice)
+        self.__loaded = {}  # name -> loaded lexicon
+        self.__lock = threading.Lock()
+
+    def register(self, name, dict_path, dice=DICE):
+        """
+        registers the dictionary file at dict_path as name. dice maps every
+        board size to the dice set used for it
+        """
+        if not os.path.isabs(dict_path):
+            dict_path = os.path.join(BASE_DIR, dict_path)
+        with self.__lock:
+            self.__entries[name] = (dict_path, dice)
+            self.__loaded.pop(name, None)
+
+    def get_names(self):
+        return list(self.__entries)
+
+    def get_path(self, name):
+        return self.__entries[name][0]
+
+    def get_dice(self, name):
+        return self.__entries[name][1]
+
+    def get_sizes(self, name):
+        return sorted(self.get_dice(name))
+
+    def get_lexicon(self, name):
+        """
+        returns the lexicon registered as name, loading it on first use
+        """
+        lexicon = self.__loaded.get(name)
+        if lexicon is None:
+            with self.__lock:  # two threads never load the same lexicon
+                lexicon = self.__loaded.get(name)
+                if lexicon is None:
+                    lexicon = load_lexicon(self.get_path(name))
+                    self.__loaded[name] = lexicon
+        return lexicon
+
+
+# The registry used by the game
+REGISTRY = LexiconRegistry()
+REGISTRY.register(DEFAULT_LEXICON, 'boggle_dict.txt')
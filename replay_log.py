@@ -0,0 +1,384 @@
+#############################################################
+# FILE: replay_log.py
+# AUTHORS: 1. Amir Harel
+#          2. Nadav Porat
+# EXERCISE: Exercise 12
+# DESCRIPTION: An append-only binary log of every round played - the board
+#              and every press, key, check and clock tick - and a reader
+#              that streams it back to replay or summarise rounds
+#############################################################
+
+import argparse
+import atexit
+import os
+import struct
+import sys
+import time
+
+from game_engine import GameEngine
+from lexicon_registry import DEFAULT_LEXICON, REGISTRY
+
+'''Magic Variables'''
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_PATH = os.path.join(BASE_DIR, 'boggle_replay.bin')
+# Set to a file path to log elsewhere, or to 0 to turn the log off
+ENV_VAR = 'BOGGLE_REPLAY'
+MAGIC = b'BGRL'
+VERSION = 1
+FILE_HEADER = MAGIC + bytes([VERSION])
+# Events are kept in memory until this many bytes, or the round's end
+FLUSH_SIZE = 1 << 16
+READ_BUFFER = 1 << 16
+
+# Event kinds
+ROUND = 'round'  # a new round - the board and the player
+PRESS = 'press'  # a tile was pressed
+TYPE = 'type'  # a letter was typed
+ERASE = 'erase'  # the last letter or tile was erased
+CLEAR = 'clear'  # the forming word was cleared without checking it
+CHECK = 'check'  # a word was checked - the word, its reaction and points
+TICK = 'tick'  # the clock shows a new second
+END = 'end'  # the round ended - the final score
+KINDS = [ROUND, PRESS, TYPE, ERASE, CLEAR, CHECK, TICK, END]
+KIND_CODES = {kind: code for code, kind in enumerate(KINDS)}
+# Reactions of checked words, as returned by GameEngine.check_word
+RESULTS = ['wrong', 'recycle', 'random', 'basic', 'impressive', 'unknown']
+RESULT_CODES = {result: code for code, result in enumerate(RESULTS)}
+
+# Every event starts with its kind and the milliseconds since the round
+# started, the fields of the kind follow. text is a length byte and UTF-8
+EVENT = struct.Struct('<BI')
+FIELDS = {
+    ROUND: struct.Struct('<dBB'),  # unix time, rows, cols, faces, player
+    PRESS: struct.Struct('<B'),  # tile index, row after row
+    TYPE: struct.Struct(''),  # the letter
+    ERASE: struct.Struct(''),
+    CLEAR: struct.Struct(''),
+    CHECK: struct.Struct('<BH'),  # result, points, the word
+    TICK: struct.Struct('<H'),  # seconds shown on the clock
+    END: struct.Struct('<I')  # score
+}
+LONGEST_TIME = 0xFFFFFFFF  # milliseconds an event time is capped at
+
+
+def encode_text(text):
+    # cut to 255 bytes without splitting a character
+    data = text.encode()[:255].decode(errors='ignore').encode()
+    return bytes([len(data)]) + data
+
+
+class ReplayWriter:
+    """
+    appends the events of every round to the log. an event is packed into
+    an in-memory buffer, which is written to the file when a round ends or
+    it grows too large, so logging costs the game a struct.pack per event
+    """
+
+    def __init__(self, path=DEFAULT_PATH, flush_size=FLUSH_SIZE):
+        self.__file = open(path, 'ab')
+        # a game that stopped mid-write left part of an event at the end,
+        # the rounds logged now must start after the last whole one
+        length = complete_length(path)
+        if length < self.__file.tell():
+            self.__file.truncate(length)
+        if length == 0:
+            self.__file.write(FILE_HEADER)
+        self.__flush_size = flush_size
+        self.__buffer = bytearray()
+        self.__start = None  # monotonic time the round started
+        self.__cols = 0
+        atexit.register(self.close)
+
+    def __event(self, kind, *fields, text=None):
+        if self.__start is None:  # no round started
+            return
+        ms = min(int((time.monotonic() - self.__start) * 1000), LONGEST_TIME)
+        self.__buffer += EVENT.pack(KIND_CODES[kind], ms)
+        self.__buffer += FIELDS[kind].pack(*fields)
+        if text is not None:
+            self.__buffer += encode_text(text)
+        if len(self.__buffer) >= self.__flush_size:
+            self.flush()
+
+    def start_round(self, board, player=''):
+        """
+        starts logging a round on board, the times of its events are
+        relative to now
+        """
+        self.__start = time.monotonic()
+        self.__cols = len(board[0])
+        self.__event(ROUND, time.time(), len(board), self.__cols)
+        for row in board:
+            for face in row:
+                self.__buffer += encode_text(face)
+        self.__buffer += encode_text(player)
+
+    def press(self, location):
+        self.__event(PRESS, location[0] * self.__cols + location[1])
+
+    def type_letter(self, letter):
+        self.__event(TYPE, text=letter)
+
+    def erase_letter(self):
+        self.__event(ERASE)
+
+    def clear_word(self):
+        self.__event(CLEAR)
+
+    def check_word(self, word, result, points):
+        self.__event(CHECK, RESULT_CODES[result], min(points, 0xFFFF),
+                     text=word)
+
+    def tick(self, seconds):
+        self.__event(TICK, min(seconds, 0xFFFF))
+
+    def end_round(self, score):
+        self.__event(END, score)
+        self.__start = None
+        self.flush()
+
+    def flush(self):
+        if self.__buffer and not self.__file.closed:
+            self.__file.write(self.__buffer)
+            self.__file.flush()
+            self.__buffer.clear()
+
+    def close(self):
+        self.flush()
+        self.__file.close()
+
+
+def writer_from_env():
+    """
+    returns the ReplayWriter of the game, or None if the log is turned off
+    or can't be written
+    """
+    path = os.environ.get(ENV_VAR, DEFAULT_PATH)
+    if path in ('', '0'):
+        return None
+    try:
+        return ReplayWriter(path)
+    except (OSError, ValueError):  # e.g. installed read-only, or corrupt
+        return None
+
+
+def read_events(path):
+    """
+    yields (kind, milliseconds, fields) for every event in the log at path,
+    reading it a buffer at a time. fields are (started_at, board, player)
+    for a round, the location of a press, the letter typed, (word, result,
+    points) for a check, the seconds of a tick, the score of an end and
+    None otherwise. a partly written event at the end of the log is ignored,
+    a corrupt one raises ValueError
+    """
+    with open(path, 'rb', buffering=READ_BUFFER) as file:
+        if file.read(len(FILE_HEADER)) != FILE_HEADER:
+            raise ValueError('not a compatible replay log')
+        yield from iter_events(file)
+
+
+def complete_length(path):
+    """
+    returns the length of the log at path without a partly written event
+    at its end, 0 if not even its header was written. the whole log is
+    read, once, when a writer opens it
+    """
+    with open(path, 'rb', buffering=READ_BUFFER) as file:
+        header = file.read(len(FILE_HEADER))
+        if header != FILE_HEADER:
+            if FILE_HEADER.startswith(header):
+                return 0
+            raise ValueError('not a compatible replay log')
+        length = file.tell()
+        for _ in iter_events(file):
+            length = file.tell()
+        return length
+
+
+def iter_events(file):
+    """
+    yields the events of an open log, read from after its header, as
+    read_events does
+    """
+    read = file.read
+
+    def read_text():
+        length = read(1)
+        data = read(length[0]) if length else b''
+        if not length or len(data) < length[0]:
+            raise EOFError
+        return data.decode(errors='replace')  # in case it was cut
+
+    cols = 1
+    while True:
+        data = read(EVENT.size)
+        if len(data) < EVENT.size:
+            return
+        code, ms = EVENT.unpack(data)
+        if code >= len(KINDS):
+            raise ValueError(f'corrupt replay log, event kind {code}')
+        kind = KINDS[code]
+        layout = FIELDS[kind]
+        data = read(layout.size)
+        if len(data) < layout.size:
+            return
+        fields = layout.unpack(data)
+        try:
+            if kind == ROUND:
+                started_at, rows, cols = fields
+                if not cols:
+                    raise ValueError('corrupt replay log, empty board')
+                faces = [read_text() for _ in range(rows * cols)]
+                board = [faces[i:i + cols]
+                         for i in range(0, rows * cols, cols)]
+                fields = (started_at, board, read_text())
+            elif kind == PRESS:
+                fields = divmod(fields[0], cols)
+            elif kind == TYPE:
+                fields = read_text()
+            elif kind == CHECK:
+                if fields[0] >= len(RESULTS):
+                    raise ValueError(
+                        f'corrupt replay log, check result {fields[0]}')
+                fields = (read_text(), RESULTS[fields[0]], fields[1])
+            elif fields:
+                fields = fields[0]
+            else:
+                fields = None
+        except EOFError:
+            return
+        yield kind, ms, fields
+
+
+class Round:
+    """
+    a single logged round - its board, who played it and its events
+    """
+
+    def __init__(self, started_at, board, player):
+        self.__started_at = started_at
+        self.__board = board
+        self.__player = player
+        self.__events = []  # (kind, milliseconds, fields)
+        self.__score = None  # None if the round didn't end
+
+    def add(self, kind, ms, fields):
+        self.__events.append((kind, ms, fields))
+        if kind == END:
+            self.__score = fields
+
+    def get_started_at(self):
+        return self.__started_at
+
+    def get_board(self):
+        return self.__board
+
+    def get_player(self):
+        return self.__player
+
+    def get_events(self):
+        return self.__events
+
+    def get_score(self):
+        return self.__score
+
+
+def iter_rounds(path):
+    """
+    yields every Round in the log at path. only one round is held in
+    memory at a time
+    """
+    current = None
+    for kind, ms, fields in read_events(path):
+        if kind == ROUND:
+            if current is not None:
+                yield current
+            current = Round(*fields)
+        elif current is not None:
+            current.add(kind, ms, fields)
+    if current is not None:
+        yield current
+
+
+def replay_round(round, lexicon):
+    """
+    plays the events of round again on a new GameEngine. returns the engine
+    and the checks whose result differs from the logged one, as (word,
+    logged (result, points), replayed (result, points))
+    """
+    engine = GameEngine(round.get_board(), lexicon)
+    mismatches = []
+    for kind, ms, fields in round.get_events():
+        if kind == PRESS:
+            engine.press(fields)
+        elif kind == TYPE:
+            engine.type_letter(fields)
+        elif kind == ERASE:
+            engine.erase_letter()
+        elif kind == CLEAR:
+            engine.clear_word()
+        elif kind == CHECK:
+            word, result, points = fields
+            replayed = engine.check_word()
+            if replayed != (result, points):
+                mismatches.append((word, (result, points), replayed))
+    return engine, mismatches
+
+
+def summarise(path):
+    """
+    returns totals over every round in the log, streamed event by event
+    """
+    counts = dict.fromkeys(KINDS, 0)
+    words = 0  # checks that scored
+    points = 0
+    for kind, ms, fields in read_events(path):
+        counts[kind] += 1
+        if kind == CHECK and fields[2]:
+            words += 1
+            points += fields[2]
+    return {'rounds': counts[ROUND], 'finished': counts[END],
+            'events': sum(counts.values()), 'presses': counts[PRESS],
+            'letters_typed': counts[TYPE], 'checks': counts[CHECK],
+            'words_scored': words, 'points': points,
+            'mean_score': points / counts[ROUND] if counts[ROUND] else 0.0}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description='Summarise or replay the rounds in a replay log')
+    parser.add_argument('log', nargs='?', default=DEFAULT_PATH,
+                        help='replay log file')
+    parser.add_argument('-r', '--replay', type=int, default=None,
+                        help='print the events of this round (from 0) and '
+                             'check it replays the same')
+    parser.add_argument('--lexicon', default=DEFAULT_LEXICON,
+                        choices=REGISTRY.get_names(),
+                        help='language of the round to replay')
+    args = parser.parse_args(argv)
+
+    if args.replay is None:
+        for name, value in summarise(args.log).items():
+            print(f'{name}: {value}')
+        return
+    for index, round in enumerate(iter_rounds(args.log)):
+        if index == args.replay:
+            break
+    else:
+        sys.exit(f'the log has no round {args.replay}')
+    print(f'{round.get_player()} at {time.ctime(round.get_started_at())}')
+    for row in round.get_board():
+        print(' '.join(f'{face:<2}' for face in row))
+    for kind, ms, fields in round.get_events():
+        print(f'{ms / 1000:8.3f} {kind} {"" if fields is None else fields}')
+    lexicon = REGISTRY.get_lexicon(args.lexicon)
+    engine, mismatches = replay_round(round, lexicon)
+    print(f'replayed score {engine.get_score()}, '
+          f'{len(mismatches)} checks differ', file=sys.stderr)
+    for word, logged, replayed in mismatches:
+        print(f'{word}: logged {logged}, replayed {replayed}',
+              file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
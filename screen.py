@@ -1,6 +1,11 @@
 from tkinter import *
 import tkinter.ttk as ttk
 import tkinter.messagebox
+import os
+from board_layout import iter_bits
+from game_clock import GameClock
+from game_state import GameStateMachine
+from instrumentation import PROFILER, timed
 
 
 class Screen:
@@ -12,18 +17,6 @@ class Screen:
     MAIN_SPLIT = 0.15  # split between Top and Bottom frames
     BOTTOM_SPLIT = 0.75  # Split between Game_Window and Player_HUD
 
-    # Dictionary to locate adjacent keys for an item
-    ADJACENT_KEYS = {
-        'up': lambda location: (location[0] - 1, location[1]),
-        'down': lambda location: (location[0] + 1, location[1]),
-        'left': lambda location: (location[0], location[1] - 1),
-        'right': lambda location: (location[0], location[1] + 1),
-        'diag_ul': lambda location: (location[0] - 1, location[1] - 1),
-        'diag_ur': lambda location: (location[0] - 1, location[1] + 1),
-        'diag_dl': lambda location: (location[0] + 1, location[1] - 1),
-        'diag_dr': lambda location: (location[0] + 1, location[1] + 1)
-    }
-
     '''Messages'''
     # Text to be displayed on the starting screen
     INITIAL_TEXT = 'Welcome to our boggle game, press start to display board'
@@ -31,11 +24,22 @@ class Screen:
 
     # Displays at the end of the countdown
     COUNT_MESSAGE = 'Good Luck!'
+    COUNT_MESSAGE_TIME = 1500  # How long it's displayed, in milliseconds
 
     # Text to be displayed on the ending screen
     END_TITLE = 'You managed to find {} words!'
     # Display the player's score
     END_SCORE = 'Your total score is: {}'
+    # Display how much of the board the player covered, and what they missed
+    END_COVERAGE = 'You found {:.0f}% of the {} words on the board ' \
+                   '(best possible score: {})'
+    MISSED_TITLE = 'Words you missed:'
+    MISSED_LENGTH = '{} letters:'
+    MISSED_PER_LINE = 6
+
+    # The leaderboard panel, one line per game
+    LEADERBOARD_TITLE = 'Leaderboard:'
+    LEADERBOARD_LINE = '{}. {} - {}'
 
     # These are the Messagebox messages for all outcomes of the game
     TIMEUP_TITLE = 'Time\'s Up!'
@@ -54,6 +58,7 @@ class Screen:
     }
 
     SETTING_ERR = ('Game is running!', 'You can\'t change settings midgame!')
+    NO_HINT = ('No hints left!', 'You found every word on the board!')
 
     '''Visual Default Settings'''
     # These are the default visual settings for the game, the player has an
@@ -85,7 +90,6 @@ class Screen:
         'recycle': 'pics/recycling.png'
 
     }
-    RANDOM_WORDS = ['AA', 'AAH', 'AAL', 'AAS', 'AB', 'ABA', 'AX']
     # The the theme chosen by the player (can be altered in settings)
     CHOSEN_THEME = 'DEFAULT'
     TOP_BAR_COLOR = THEME[CHOSEN_THEME][0]  # Background for top frame
@@ -100,25 +104,42 @@ class Screen:
 
     # The base padding for all items on screen - Not alterable
     PAD = 5
+    # Background of the tiles of a hint, and how long it's shown (ms)
+    HINT_BG = '#8C3A3A'
+    HINT_TIME = 1500
+    # Background of the tiles that spell the word typed on the keyboard
+    TYPED_BG = '#3A8C5A'
 
     '''Default Game Settings'''
     # The length of the game - can be changed in settings
     GAME_TIME = 180
     COUNTDOWN = 3
-
-    def __init__(self):
+    # The board is BOARD_SIZE x BOARD_SIZE, one of the sizes the language
+    # has dice for
+    BOARD_SIZE = 4
+    # The lexicon the game is played with, one of the registered languages
+    LANGUAGE = ''
+    # The name the player's games are saved under
+    PLAYER = 'Player'
+
+    def __init__(self, events=None):
+        # The game's state machine, events on the screen are fired into it
+        self.__events = events or GameStateMachine()
+        self.__game = None  # The GameEngine of the current game
+        # Languages to choose from, each with the board sizes it has dice for
+        self.__languages = {self.LANGUAGE: [self.BOARD_SIZE]}
         self.__init_vars()
         self.__init_screen()  # Creates all the screen components
 
     def __init_vars(self):
-        self.__score = 0  # Player's score
-        self.__bank = []  # Words found by the player
-        self.__curr_word = ''  # The word the player is currently forming
         self.clock_running = False  # The state of the clock
-        self.__player = ''  # The players name
-        self.__game_status = False  # determines whether a game should end
-        self.press_bank = []  # Letters the player clicked on
+        self.__shown_words = 0  # Found words already in the bank list
         self.stopclock = False  # Should the clock be stopped
+        self.game_clock = GameClock(self.GAME_TIME)  # Time left in the game
+        self.__shown_time = None  # The time displayed on the clock
+        self.__clock_job = None  # The scheduled tick of the clock
+        self.__hint_path = None  # The tiles of the hint shown, if any
+        self.__hint_job = None  # The scheduled hiding of the hint
 
         self.score_bank = {}
 
@@ -137,6 +158,9 @@ class Screen:
         self.__root.minsize(width=self.screen_width + 180,
                             height=self.screen_height + 120)
 
+        # Typing mode - the keyboard can be used instead of the tiles
+        self.__root.bind('<Key>', self.key_press)
+
         # Initiates the topleven menu
         self.toplevel_menu()
         # Adds the top frame
@@ -149,19 +173,52 @@ class Screen:
     def set_title(self, title):
         self.__root.title(title)
 
-    def set_dict(self, dict):
-        # Should be in boggle.py
-        self.__dict = dict
-
-    def set_board(self, board):
-        # Should be in boggle.py
-        self.__board = board
+    def set_game(self, game):
+        # game is the GameEngine that holds the board, words and score, the
+        # screen only displays it. a new game is set every time start is
+        # pressed
+        self.__game = game
+
+    def get_board_size(self):
+        return self.BOARD_SIZE
+
+    def set_languages(self, languages, chosen):
+        # languages maps the names of the lexicons the player can choose from
+        # to the board sizes each can be played on
+        self.__languages = {language: list(sizes)
+                            for language, sizes in languages.items()}
+        self.LANGUAGE = chosen
+        self.BOARD_SIZE = self.fit_size(chosen, self.BOARD_SIZE)
+
+    def get_sizes(self, language):
+        return self.__languages[language]
+
+    def fit_size(self, language, size):
+        # returns size if language has dice for it, or its nearest size
+        return min(self.get_sizes(language),
+                   key=lambda other: (abs(other - size), other))
+
+    def get_language(self):
+        return self.LANGUAGE
+
+    def get_player(self):
+        return self.PLAYER
+
+    def set_leaderboard(self, games):
+        # games are (player, board, words, score, duration, played_at), the
+        # best first
+        self.leaderboard_container.delete(2, END)
+        self.leaderboard_container.insert(END, *(
+            self.LEADERBOARD_LINE.format(rank, game[0], game[3])
+            for rank, game in enumerate(games, 1)))
 
     def start_screen(self):
         self.__root.mainloop()
 
     def set_game_status(self, status):
-        self.__game_status = status
+        # status is an event of the state machine, e.g. 'retry' or 'exit'.
+        # returns False if the event can't happen in the current state
+        return self.__events.fire(status)
 
     '''Toplevel Menu Methods'''
 
@@ -169,6 +226,7 @@ class Screen:
         menubar = Menu(self.__root)
         filemenu = Menu(menubar, tearoff=0)
         filemenu.add_command(label="Options", command=self.options)
+        filemenu.add_command(label="Hint", command=self.show_hint)
         filemenu.add_separator()
         filemenu.add_command(label="Exit", command=self.forcexit)
         menubar.add_cascade(label="File", menu=filemenu)
@@ -177,9 +235,13 @@ class Screen:
     def forcexit(self):
         if self.clock_running:  # user ends early
             self.stopclock = True
+            self.game_clock.stop()
+            if self.__clock_job is not None:
+                self.__root.after_cancel(self.__clock_job)
+            self.clock_running = False
             self.end(type='EARLY')
         else:  # game is over
-            self.__game_status = 'exit'
+            self.set_game_status('exit')
 
     '''Options window methods'''
 
@@ -206,6 +268,13 @@ class Screen:
         # Setting the game time
         self.GAME_TIME = (self.time_min.get()) * 60 + self.time_sec.get()
         self.COUNTDOWN = self.countdown_duration.get()
+        language = self.language.get()
+        size = self.fit_size(language, self.board_size.get())
+        if size != self.BOARD_SIZE or language != self.LANGUAGE:
+            self.BOARD_SIZE = size
+            self.LANGUAGE = language
+            self.set_game_status('settings')  # asks for a new board
+        self.PLAYER = self.player_name.get().strip() or self.PLAYER
         self.update_text()
 
         # Closing the Options menu after saving the changed settings
@@ -219,6 +288,9 @@ class Screen:
         self.menu_note.add(self.game_settings, text='Game Settings')
         self.gametime()  # adding the game duration setting option
         self.countdown_timer()
+        self.board_size_setting()
+        self.language_setting()
+        self.player_setting()
 
     def gametime(self):
         # Container Frame for the Game Duration setting
@@ -268,6 +340,69 @@ class Screen:
         self.countdown_duration.set(self.COUNTDOWN)
         self.countdown_options.pack(side=LEFT)
 
+    def board_size_setting(self):
+        # Container Frame for the board size setting
+        self.board_size_frame = ttk.Frame(self.game_settings)
+        self.board_size_frame.pack(side=TOP)
+
+        # The label for the board size setting
+        self.board_size_title = ttk.Label(self.board_size_frame,
+                                          text="Board Size:")
+        self.board_size_title.pack(side=LEFT)
+
+        # Making an IntVar object that will hold the chosen board size, only
+        # the sizes the chosen language has dice for are offered
+        self.board_size = IntVar(self.board_size_frame)
+        self.board_size_options = ttk.OptionMenu(
+            self.board_size_frame, self.board_size, self.BOARD_SIZE,
+            *self.get_sizes(self.LANGUAGE))
+        self.board_size.set(self.BOARD_SIZE)
+        self.board_size_options.pack(side=LEFT)
+
+    def language_setting(self):
+        # Container Frame for the language setting
+        self.language_frame = ttk.Frame(self.game_settings)
+        self.language_frame.pack(side=TOP)
+
+        # The label for the language setting
+        self.language_title = ttk.Label(self.language_frame,
+                                        text="Language:")
+        self.language_title.pack(side=LEFT)
+
+        # Making a StringVar object that will hold the chosen language
+        self.language = StringVar(self.language_frame)
+        self.language_options = ttk.OptionMenu(self.language_frame,
+                                               self.language,
+                                               self.LANGUAGE,
+                                               *self.__languages)
+        self.language.set(self.LANGUAGE)
+        self.language_options.pack(side=LEFT)
+        # Offering the sizes of the language whenever another one is chosen
+        self.language.trace_add('write', self.language_changed)
+
+    def language_changed(self, *args):
+        language = self.language.get()
+        size = self.fit_size(language, self.board_size.get())
+        self.board_size_options.set_menu(size, *self.get_sizes(language))
+
+    def player_setting(self):
+        # Container Frame for the player name setting
+        self.player_frame = ttk.Frame(self.game_settings)
+        self.player_frame.pack(side=TOP)
+
+        # The label for the player name setting
+        self.player_title = ttk.Label(self.player_frame,
+                                      text="Player Name:")
+        self.player_title.pack(side=LEFT)
+
+        # Making a StringVar object that will hold the player's name
+        self.player_name = StringVar(self.player_frame)
+        self.player_entry = ttk.Entry(self.player_frame,
+                                      textvariable=self.player_name,
+                                      width=15)
+        self.player_name.set(self.PLAYER)
+        self.player_entry.pack(side=LEFT)
+
     '''Visual Settings Methods'''
 
     def visual_settings_window(self):
@@ -305,7 +440,7 @@ class Screen:
         self.forming_word_title.pack(side=LEFT, padx=self.PAD)
         # Creates the forming word dynamic label
         self.forming_word = Label(self.forming_word_container,
-                                  text=f'{self.__curr_word}',
+                                  text='',
                                   font=self.SIZES['large'],
                                   bg=self.TOP_BAR_COLOR)
         self.forming_word.pack(side=LEFT, padx=self.PAD)
@@ -355,6 +490,7 @@ class Screen:
         self.pane.pack(side=TOP, fill='both', expand=True, pady=self.PAD,
                        padx=self.PAD)
         self.found_words_section()
+        self.leaderboard_section()
         self.imageframe = Frame(self.player_hud,
                                 bg=self.PLAYER_HUD_COLOR,
                                 height=50,
@@ -362,6 +498,7 @@ class Screen:
                                 bd=3)
         self.imageframe.pack(side=BOTTOM, fill='both', expand=True,
                              padx=self.PAD, pady=self.PAD)
+        self.reaction_section()
         self.put_picture(self.DEFAULT_PIC)  # adds default picture
 
     def score_section(self):
@@ -377,7 +514,7 @@ class Screen:
         self.score_title.pack(side=TOP, fill=X)
 
         self.score_label = Label(self.score_container,
-                                 text=f'{self.__score}',
+                                 text='0',
                                  bg=self.BOX_BG,
                                  fg=self.BOX_FG,
                                  font=self.SIZES['small'])
@@ -396,9 +533,21 @@ class Screen:
         self.bank_container.config(yscrollcommand=self.scrollbar.set)
         self.scrollbar.config(command=self.bank_container.yview)
 
+    def leaderboard_section(self):
+        # Leaderboard, filled by the game from the saved games
+        self.leaderboard_container = Listbox(self.pane,
+                                             bg=self.BOX_BG,
+                                             fg=self.BOX_FG,
+                                             font=self.SIZES['small'])
+        self.pane.add(self.leaderboard_container)
+        self.leaderboard_container.insert(END, self.LEADERBOARD_TITLE, '')
+
     '''General gameplay - Most should move to boggle.py'''
 
+    @timed('screen.end')
     def end(self, type='TIMEUP'):
+        self.hide_hint()
+        self.set_game_status('end')
         self.end_frame = Frame(self.game_window, bg=self.GAME_WINDOW_COLOR)
         self.end_frame.pack(expand=True)
         self.main_button.config(state=DISABLED)
@@ -406,16 +555,19 @@ class Screen:
                                     self.ENDERS[type][1])
         self.board_frame.pack_forget()
         self.end_title = Label(self.end_frame,
-                               text=self.END_TITLE.format(len(self.__bank)),
+                               text=self.END_TITLE.format(
+                                   len(self.__game.get_found())),
                                bg=self.GAME_WINDOW_COLOR,
                                font=self.SIZES['large'])
         self.end_title.pack(side=TOP, fill=X, expand=True)
 
         self.end_score = Label(self.end_frame,
-                               text=self.END_SCORE.format(self.__score),
+                               text=self.END_SCORE.format(
+                                   self.__game.get_score()),
                                bg=self.GAME_WINDOW_COLOR,
                                font=self.SIZES['large'])
         self.end_score.pack(side=TOP, fill=X, expand=True)
+        self.report_section()
         self.buttonframe = Frame(self.end_frame, bg=self.GAME_WINDOW_COLOR)
         self.buttonframe.pack(side=TOP, padx=self.PAD, pady=self.PAD)
 
@@ -430,120 +582,232 @@ class Screen:
                                        'retry'))
         self.retrybtn.pack(side=LEFT)
 
-    def tick_clock(self, time):
-        if not self.clock_running:
-            self.clock_running = True
-        t = divmod(time, 60)
-        now = f'{t[0]:0>2}:{t[1]:0>2}'
-        self.clock_label.config(text=now)
+    def report_section(self):
+        """
+        shows how much of the board the player covered and every word they
+        missed, grouped by length. the board was solved before the game so
+        nothing is computed here
+        """
+        report = self.__game.get_report()
+        self.end_coverage = Label(self.end_frame,
+                                  text=self.END_COVERAGE.format(
+                                      report.get_coverage(),
+                                      report.get_total(),
+                                      report.get_max_score()),
+                                  bg=self.GAME_WINDOW_COLOR,
+                                  font=self.SIZES['medium'])
+        self.end_coverage.pack(side=TOP, fill=X, expand=True)
+
+        self.missed_container = Listbox(self.end_frame,
+                                        bg=self.BOX_BG,
+                                        fg=self.BOX_FG,
+                                        font=self.SIZES['small'],
+                                        height=10)
+        self.missed_container.pack(side=TOP, fill=X, padx=self.PAD,
+                                   pady=self.PAD)
+        self.missed_container.insert(END, self.MISSED_TITLE)
+        for length, words in sorted(report.get_missed_by_length().items(),
+                                    reverse=True):
+            self.missed_container.insert(END, '',
+                                         self.MISSED_LENGTH.format(length))
+            for i in range(0, len(words), self.MISSED_PER_LINE):
+                self.missed_container.insert(
+                    END, ', '.join(words[i:i + self.MISSED_PER_LINE]))
+
+    @timed('screen.show_hint')
+    def show_hint(self):
+        """
+        lights up the tiles of a word the player didn't find yet
+        """
+        if not self.clock_running or self.__game is None:
+            return
+        path = self.__game.get_hint()
+        if path is None:
+            tkinter.messagebox.showinfo(self.NO_HINT[0], self.NO_HINT[1])
+            return
+        self.hide_hint()  # a hint already shown makes way for this one
+        for location in path:
+            self.buttons[location].config(bg=self.HINT_BG)
+        self.__hint_path = path
+        self.__hint_job = self.__root.after(self.HINT_TIME, self.hide_hint)
+
+    def hide_hint(self):
+        """
+        puts back the colours of the tiles of the hint shown, if any. the
+        scheduled hiding is cancelled if the hint is hidden before it
+        """
+        if self.__hint_job is not None:
+            self.__root.after_cancel(self.__hint_job)
+            self.__hint_job = None
+        path, self.__hint_path = self.__hint_path, None
+        if path is None or self.__game is None:
+            return
+        for location in path:
+            self.buttons[location].config(bg=self.TILE_BG)
+        self.__highlighted = set()
+        self.highlight_path()  # the typed word may share tiles with it
+
+    def start_clock(self):
+        self.game_clock = GameClock(self.GAME_TIME).start()
+        self.clock_running = True
+        self.tick_clock()
+
+    @timed('screen.tick_clock')
+    def tick_clock(self):
+        """
+        updates the clock from the game clock's end instant, so the game
+        lasts GAME_TIME no matter how late the callbacks run
+        """
+        self.__clock_job = None
         if self.stopclock:
             self.clock_running = False
             return
-        elif time == 0:
+        time = self.game_clock.get_display_seconds()
+        if time != self.__shown_time:  # only renders when the second changes
+            self.__shown_time = time
+            t = divmod(time, 60)
+            self.clock_label.config(text=f'{t[0]:0>2}:{t[1]:0>2}')
+            self.__events.fire('tick', time)
+        if self.game_clock.is_over():
             self.clock_running = False
             self.end()
         else:
-            time -= 1
-            self.__root.after(1000, self.tick_clock, time)
+            self.__clock_job = self.__root.after(
+                self.game_clock.get_next_change(), self.tick_clock)
+
+    def get_elapsed(self):
+        return self.game_clock.get_elapsed()
+
+    def get_remaining(self):
+        return self.game_clock.get_remaining()
 
     def get_game_status(self):
-        return self.__game_status
+        return self.__events.get_state()
 
     def get_root(self):
         return self.__root
 
+    @timed('screen.countdown')
     def countdown(self, counting):
         if counting == 'start':
-            counting = self.COUNTDOWN
             self.initial_label.pack_forget()
-            if counting == 0:
-                self.display_board()
-                self.tick_clock(self.GAME_TIME)
-                self.main_button.config(text='Check')
-                return
+            if self.COUNTDOWN == 0:
+                return self.begin_game()
+            self.countdown_clock = GameClock(self.COUNTDOWN).start()
             self.countdown_frame = Frame(self.game_window)
             self.countdown_frame.pack(expand=True)
             self.countdown_label = Label(self.countdown_frame,
-                                         text=counting,
+                                         text=self.COUNTDOWN,
                                          font=self.SIZES['gigantic'],
                                          bg=self.GAME_WINDOW_COLOR,
                                          justify=CENTER)
             self.countdown_label.pack(expand=True)
-            self.__root.after(1000, self.countdown, counting)
-        elif counting > 1:
-            counting -= 1
-            self.countdown_label.config(text=counting)
-            self.__root.after(1000, self.countdown, counting)
-        elif counting == 1:
+        elif counting == 'done':
+            self.countdown_frame.pack_forget()
+            return self.begin_game()
+        if self.countdown_clock.is_over():
             self.countdown_label.config(text=self.COUNT_MESSAGE)
-            counting -= 1
-            self.__root.after(1500, self.countdown, counting)
+            self.__root.after(self.COUNT_MESSAGE_TIME, self.countdown, 'done')
         else:
-            self.countdown_frame.pack_forget()
-            self.display_board()
-            self.tick_clock(self.GAME_TIME)
-            self.main_button.config(text='Check')
+            self.countdown_label.config(
+                text=self.countdown_clock.get_display_seconds())
+            self.__root.after(self.countdown_clock.get_next_change(),
+                              self.countdown, 'tick')
 
+    def begin_game(self):
+        self.display_board()
+        self.start_clock()
+        self.main_button.config(text='Check')
+
+    @timed('screen.update_bank')
     def update_bank(self):
-        self.__bank.append(self.__curr_word)
-        self.bank_container.insert(END, self.__curr_word)
-
-    def check_word(self, undo=False):
-        key = self.picture_key(self.__curr_word)
-        if not undo:  # makes sure not to affect image if just unclicking
-            if self.image:  # forgets if image is there
-                self.image.pack_forget()
-            Screen.put_picture(self, key)
-        if (self.__curr_word in self.__dict) and (self.__curr_word not in self.__bank):
-            self.__score += len(self.__curr_word) ** 2
-            self.score_label.config(text=f'{self.__score}')
+        # only inserts the words found since the last update
+        found = self.__game.get_found()
+        new_words = found.get_since(self.__shown_words)
+        if new_words:
+            self.bank_container.insert(END, *new_words)
+            self.__shown_words = len(found)
+
+    @timed('screen.check_word')
+    def check_word(self):
+        key, points = self.__game.check_word()
+        self.put_picture(key)
+        if points:
+            self.score_label.config(text=f'{self.__game.get_score()}')
             self.update_bank()
 
-    def clear_word(self, undo=False):
-        self.check_word(undo)
-        self.__curr_word = ''
-        self.press_bank = []
-        self.forming_word.config(text=f'{self.__curr_word}')
-        for loc in self.__board:
-            self.buttons[loc].config(state=NORMAL)
-            if self.__board[loc].get_status():
-                self.__board[loc].press()
-
-    def add_letter(self, letter):
-        self.__curr_word += letter.get_data().upper()
-        self.forming_word.config(text=f'{self.__curr_word}')
-
-    def press(self, location, re=False):
-        if self.__board[location].get_status():
-            if len(self.press_bank) == 1:
-                return self.clear_word(True)
-            else:
-                self.__board[self.press_bank.pop()].press()
-                self.__board[self.press_bank[-1]].press()
-                return self.press(self.press_bank.pop(), re=True)
-        self.press_bank.append(location)
-        items = [self.ADJACENT_KEYS[key](location)
-                 for key in self.ADJACENT_KEYS]
-        # objects = [self.board[item] if item in self.board for item in items]
-        self.__board[location].press()
-        # self.buttons[location].config(state=DISABLED)
-        for i, j in self.buttons:
-            if (i, j) == location:
-                self.buttons[(i, j)].config(state=NORMAL)
-                continue
-            if (i, j) in items:
-                if self.__board[(i, j)].get_status():
-                    self.buttons[(i, j)].config(state=DISABLED)
-                else:
-                    self.buttons[(i, j)].config(state=NORMAL)
-            else:
-                self.buttons[(i, j)].config(state=DISABLED)
-        if re:
-            self.__curr_word = self.__curr_word[:-1]
-            self.forming_word.config(text=f'{self.__curr_word}')
+    @timed('screen.clear_word')
+    def clear_word(self, check=True):
+        # checks the forming word and clears it, Escape clears it unchecked
+        if check:
+            self.check_word()
+        else:
+            self.__game.clear_word()
+        self.forming_word.config(text=self.__game.get_word())
+        self.update_buttons()
+        self.highlight_path()
+
+    @timed('screen.press')
+    def press(self, location):
+        if not self.__game.press(location):
+            return
+        self.forming_word.config(text=self.__game.get_word())
+        self.update_buttons()
+        self.highlight_path()
+
+    @timed('screen.key_press')
+    def key_press(self, event):
+        """
+        typing mode - letters extend the forming word, BackSpace erases the
+        last letter or pressed tile, Return checks the word and Escape
+        clears it
+        """
+        if not self.clock_running or self.__game is None:
+            return
+        if event.keysym == 'Return':
+            return self.clear_word()
+        if event.keysym == 'Escape':
+            return self.clear_word(check=False)
+        if event.keysym == 'BackSpace':
+            self.__game.erase_letter()
+        elif len(event.char) == 1 and event.char.isalpha():
+            self.__game.type_letter(event.char)
+        else:
             return
-        return self.add_letter(self.__board[location])
+        self.forming_word.config(text=self.__game.get_word())
+        self.update_buttons()
+        self.highlight_path()
 
+    @timed('screen.highlight_path')
+    def highlight_path(self):
+        """
+        lights up a path that spells the typed word, only touching the
+        tiles whose colour changed
+        """
+        path = None
+        if self.__game.is_typing():
+            path = self.__game.get_path()
+        highlighted = set(path or ())
+        for location in highlighted ^ self.__highlighted:
+            bg = self.TYPED_BG if location in highlighted else self.TILE_BG
+            self.buttons[location].config(bg=bg)
+        self.__highlighted = highlighted
+
+    @timed('screen.update_buttons')
+    def update_buttons(self):
+        """
+        enables the tiles that can be pressed next and disables the rest,
+        only touching the buttons whose state changed
+        """
+        enabled = self.__game.get_enabled()
+        for index in iter_bits(enabled ^ self.__enabled):
+            state = NORMAL if enabled >> index & 1 else DISABLED
+            self.buttons[self.__game.get_location(index)].config(
+                state=state)
+            PROFILER.count('tk.button_config')
+        self.__enabled = enabled
+
+    @timed('screen.display_board')
     def display_board(self):
         # makes a frame for the game tiles
         self.board_frame = Frame(self.game_window,
@@ -552,69 +816,67 @@ class Screen:
 
         self.buttons = {}  # dictionary that will hold the buttons
         # makes the buttons based on the game board
-        for i, j in self.__board:
-            self.buttons[(i, j)] = (
-                Button(self.board_frame,
-                       text=str(self.__board[(i, j)]),
-                       command=lambda item=(i, j): self.press(
-                           item),
-                       font=self.SIZES['large'],
-                       width=5,
-                       height=2,
-                       fg=self.TILE_FG,
-                       bg=self.TILE_BG))
-            # places each tile in a grid
-            self.buttons[(i, j)].grid(row=i, column=j,
-                                      padx=self.PAD, pady=self.PAD)
-
-    def picture_key(self, word):
+        for i, row in enumerate(self.__game.get_board()):
+            for j, face in enumerate(row):
+                self.buttons[(i, j)] = (
+                    Button(self.board_frame,
+                           text=face,
+                           command=lambda item=(i, j): self.press(item),
+                           font=self.SIZES['large'],
+                           width=5,
+                           height=2,
+                           fg=self.TILE_FG,
+                           bg=self.TILE_BG))
+                # places each tile in a grid
+                self.buttons[(i, j)].grid(row=i, column=j,
+                                          padx=self.PAD, pady=self.PAD)
+        # a bitmask of the enabled buttons
+        self.__enabled = self.__game.get_enabled()
+        # the tiles lit up for the typed word
+        self.__highlighted = set()
+
+    def reaction_section(self):
         """
-        returns appropriate key for picture
+        loads every reaction picture once and creates the single label that
+        shows them
         """
-        if word not in self.__dict:
-            return 'wrong'
-        if word in self.__bank:
-            return 'recycle'
-        if word in Screen.RANDOM_WORDS:
-            return 'random'
-        if len(word) <= 3:
-            return 'basic'
-        if len(word) <= 8:
-            return 'impressive'
-        return 'unknown'
+        base_dir = os.path.dirname(os.path.abspath(__file__))
+        self.pictures = {key: PhotoImage(file=os.path.join(base_dir, path))
+                         for key, path in Screen.PICS.items()}
+        self.image = Label(self.imageframe, borderwidth=0,
+                           highlightthickness=0, bg=self.PLAYER_HUD_COLOR)
+        self.image.pack(side=BOTTOM, padx=self.PAD,
+                        pady=self.PAD, expand=True, fill='both')
 
+    @timed('screen.put_picture')
     def put_picture(self, dic_key):
         """
-        adds picture to the screen
+        shows the picture of dic_key in the reaction label
         """
-        path = Screen.PICS[dic_key]
-        photo = PhotoImage(file=path)
-        photo = photo.subsample(1, 1)
-        self.image = Label(self.imageframe, image=photo, borderwidth=0,
-                           highlightthickness=0, bg=self.PLAYER_HUD_COLOR)
-        self.image.image = photo
-        self.image.pack(side=BOTTOM, padx=self.PAD,
-                        pady=self.PAD, expand=True, fill='both')
+        self.image.config(image=self.pictures[dic_key])
 
+    @timed('screen.start')
     def start(self):
         if self.clock_running:
             self.clear_word()
-        else:
+        elif self.set_game_status('start'):  # not already counting down
             self.countdown('start')
 
     def update_text(self):
         t = divmod(self.GAME_TIME, 60)
         self.clock_label.config(text=f'{t[0]:0>2}:{t[1]:0>2}')
-        self.forming_word.config(text=f'{self.__curr_word}')
-        self.score_label.config(text=f'{self.__score}')
+        score = self.__game.get_score() if self.__game else 0
+        self.forming_word.config(text='')
+        self.score_label.config(text=f'{score}')
         self.bank_container.delete(2, END)
-        self.image.pack_forget()
         self.put_picture(self.DEFAULT_PIC)
 
     def reset_screen(self):
+        self.hide_hint()
         self.end_frame.pack_forget()
         self.initial_label.config(text=self.RETRY_LABEL)
         self.initial_label.pack(expand=True)
         self.__init_vars()
+        self.__game = None  # the next game is set when start is pressed
         self.update_text()
         self.main_button.config(text='Start', state=NORMAL)
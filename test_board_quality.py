@@ -0,0 +1,55 @@
+#############################################################
+# FILE: test_board_quality.py
+# AUTHORS: 1. Amir Harel
+#          2. Nadav Porat
+# EXERCISE: Exercise 12
+# DESCRIPTION: Tests for rejecting poor boards and the pool of good ones
+#############################################################
+
+import random
+
+import pytest
+
+from board_quality import BoardFilter, QualityBoardPool
+from boggle_board_randomizer import DICE
+from boggle_solver import solve_board
+from lexicon import Lexicon
+
+LEXICON = Lexicon(['AT', 'TA', 'EAT', 'TEA', 'ATE', 'SEAT', 'EAST',
+                   'RATE', 'TEAR', 'STARE'])
+
+
+def test_filter_accepts_boards_with_enough_words():
+    board_filter = BoardFilter(LEXICON, min_words=3, min_score=0,
+                               min_long_words=0)
+    board, words = board_filter.generate(random.Random(2))
+    assert len(words) >= 3 and words == solve_board(board, LEXICON)
+    tries, accepted, seconds = board_filter.get_stats()
+    assert accepted == 1 and tries >= 1
+
+
+def test_filter_gives_the_best_board_after_max_tries():
+    board_filter = BoardFilter(LEXICON, min_words=100)
+    board, words = board_filter.generate(random.Random(2), max_tries=20)
+    assert board_filter.get_stats()[:2] == (20, 0)
+    assert words == solve_board(board, LEXICON)
+
+
+def test_pool_fills_up_and_stops():
+    pool = QualityBoardPool(BoardFilter(LEXICON, 0, 0, 0), capacity=2,
+                            seed=1)
+    board = pool.get()  # waits for the first board if none is ready
+    assert board.get_words() == solve_board(board.get_board(), LEXICON)
+    assert not pool.join(0.2)  # the full pool keeps its thread waiting
+    assert pool.get_ready() == 2
+    pool.stop()
+    assert pool.join(5)
+
+
+def test_pool_error_is_raised_by_get():
+    pool = QualityBoardPool(BoardFilter(LEXICON, 0, 0, 0), size=7,
+                            dice=DICE)
+    for _ in range(2):
+        with pytest.raises(KeyError):  # no dice for 7x7 boards
+            pool.get()
+    assert pool.join(5)
@@ -0,0 +1,54 @@
+#############################################################
+# FILE: test_boggle_board_randomizer.py
+# AUTHORS: 1. Amir Harel
+#          2. Nadav Porat
+# EXERCISE: Exercise 12
+# DESCRIPTION: Tests for rolling boards and packing them into face codes
+#############################################################
+
+import random
+
+import pytest
+
+from boggle_board_randomizer import DICE, decode_board, encode_board, \
+    generate_boards, iter_boards, randomize_board
+
+
+@pytest.mark.parametrize('size', sorted(DICE))
+def test_same_seed_gives_the_same_board(size):
+    board = randomize_board(random.Random(7), size)
+    assert board == randomize_board(random.Random(7), size)
+    assert board == randomize_board(random.Random(7), size, DICE)
+    assert len(board) == size and all(len(row) == size for row in board)
+    assert board != randomize_board(random.Random(8), size)
+
+
+@pytest.mark.parametrize('size', sorted(DICE))
+def test_dice_are_shuffled_into_the_cells(size):
+    faces = {face for die in DICE[size] for face in die}
+    corners = set()
+    for seed in range(50):
+        board = randomize_board(random.Random(seed), size)
+        assert all(face in faces for row in board for face in row)
+        corners.add(board[0][0])
+    # a single die in the corner would only ever show its six faces
+    assert len(corners) > 6
+
+
+def test_generate_boards_is_reproducible():
+    codes = generate_boards(20, seed=3, size=5)
+    assert len(codes) == 20 * 25
+    assert codes == generate_boards(20, seed=3, size=5)
+    assert codes != generate_boards(20, seed=4, size=5)
+    assert decode_board(codes, 0, 5) == randomize_board(random.Random(3), 5)
+
+
+@pytest.mark.parametrize('size', sorted(DICE))
+def test_encode_decode_round_trip(size):
+    codes = generate_boards(10, seed=size, size=size)
+    boards = list(iter_boards(codes, size))
+    assert len(boards) == 10
+    assert b''.join(encode_board(board) for board in boards) == codes
+    for index, board in enumerate(boards):
+        assert decode_board(encode_board(board), size=size) == board
+        assert decode_board(codes, index, size) == board
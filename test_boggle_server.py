@@ -0,0 +1,91 @@
+#############################################################
+# FILE: test_boggle_server.py
+# AUTHORS: 1. Amir Harel
+#          2. Nadav Porat
+# EXERCISE: Exercise 12
+# DESCRIPTION: Tests for the multiplayer server, over a real connection
+#############################################################
+
+import asyncio
+import json
+import threading
+
+import pytest
+
+import boggle_server
+from boggle_server import BoggleServer, encode
+from lexicon import Lexicon
+
+BOARD = [['C', 'A', 'T', 'S'],
+         ['Qu', 'I', 'E', 'T'],
+         ['X', 'X', 'X', 'X'],
+         ['X', 'X', 'X', 'X']]
+CAT = [[0, 0], [0, 1], [0, 2]]
+
+
+@pytest.fixture(autouse=True)
+def fixed_board(monkeypatch):
+    monkeypatch.setattr(boggle_server, 'randomize_board',
+                        lambda size, dice: [list(row) for row in BOARD])
+
+
+def play(*messages):
+    """
+    sends messages to a new server in a single write and returns every
+    result or error it answers with
+    """
+    async def session():
+        server = BoggleServer(Lexicon(['CAT', 'CATS', 'QUIET']), 60)
+        await server.start('127.0.0.1', 0)
+        reader, writer = await asyncio.open_connection('127.0.0.1',
+                                                       server.get_port())
+        writer.write(b''.join(encode(message) for message in messages))
+        answers = []
+        expected = sum(message['type'] == 'word' for message in messages)
+        while len(answers) < expected:
+            message = json.loads(await reader.readline())
+            if message['type'] in ('result', 'error'):
+                answers.append(message)
+        writer.close()
+        return answers
+    return asyncio.run(session())
+
+
+def test_word_sent_with_join_is_checked_against_the_board():
+    join = {'type': 'join', 'room': 'r', 'player': 'a'}
+    first, second = play(join, {'type': 'word', 'word': 'cat'},
+                         {'type': 'word', 'word': 'quiet', 'path':
+                          [[1, 0], [1, 1], [1, 2], [1, 3]]})
+    assert first['reason'] == 'accepted' and first['points'] == 9
+    assert second['reason'] == 'accepted' and second['score'] == 34
+
+
+def test_bad_path_keeps_the_connection():
+    join = {'type': 'join', 'room': 'r', 'player': 'a'}
+    number, bad_tile, cat = play(
+        join, {'type': 'word', 'word': 'AB', 'path': 5},
+        {'type': 'word', 'word': 'CAT', 'path': [[0, 0], 7]},
+        {'type': 'word', 'word': 'CAT', 'path': CAT})
+    assert number['reason'] == 'off_board'
+    assert bad_tile['reason'] == 'off_board'
+    assert cat['reason'] == 'accepted'
+
+
+def test_duplicate_word():
+    join = {'type': 'join', 'room': 'r', 'player': 'a'}
+    first, again = play(join, {'type': 'word', 'word': 'CAT'},
+                        {'type': 'word', 'word': 'CAT', 'path': CAT})
+    assert again['reason'] == 'duplicate' and again['score'] == 9
+
+
+def test_board_is_solved_off_the_event_loop(monkeypatch):
+    threads = []
+
+    def solve(board, lexicon):
+        threads.append(threading.get_ident())
+        return {}
+    monkeypatch.setattr(boggle_server, 'solve_board', solve)
+    join = {'type': 'join', 'room': 'r', 'player': 'a'}
+    result, = play(join, {'type': 'word', 'word': 'CAT'})
+    assert result['reason'] == 'not_on_board'
+    assert threads and threading.get_ident() not in threads
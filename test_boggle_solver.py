@@ -0,0 +1,71 @@
+#############################################################
+# FILE: test_boggle_solver.py
+# AUTHORS: 1. Amir Harel
+#          2. Nadav Porat
+# EXERCISE: Exercise 12
+# DESCRIPTION: Tests for finding every word on a board
+#############################################################
+
+from board_layout import neighbour_table
+from boggle_solver import max_score, solve_board
+from lexicon import Lexicon
+from lexicon_registry import DEFAULT_LEXICON, REGISTRY
+
+BOARD = [['S', 'T', 'E', 'R'],
+         ['Qu', 'I', 'A', 'N'],
+         ['E', 'T', 'L', 'D'],
+         ['O', 'R', 'E', 'S']]
+# Paths up to this many tiles are searched by brute force
+MAX_TILES = 5
+
+
+def brute_force(board, lexicon, max_tiles=MAX_TILES):
+    """
+    returns every word in lexicon spelled by a path of up to max_tiles
+    tiles, trying every path on the board
+    """
+    neighbours = neighbour_table(len(board), len(board[0]))
+    found = set()
+
+    def extend(path, word):
+        if len(word) >= 2 and word in lexicon:
+            found.add(word)
+        if len(path) == max_tiles:
+            return
+        for i, j in neighbours[path[-1]]:
+            if (i, j) not in path:
+                extend(path + [(i, j)], word + board[i][j].upper())
+
+    for i, row in enumerate(board):
+        for j, face in enumerate(row):
+            extend([(i, j)], face.upper())
+    return found
+
+
+def check_path(board, word, path):
+    assert len(set(path)) == len(path)
+    for first, second in zip(path, path[1:]):
+        assert second in neighbour_table(len(board), len(board[0]))[first]
+    assert ''.join(board[i][j] for i, j in path).upper() == word
+
+
+def test_small_lexicon():
+    lexicon = Lexicon(['QUIT', 'QUITE', 'QI', 'SQUIT', 'TIE', 'SEA', 'A'])
+    words = solve_board(BOARD, lexicon)
+    # Q is only on the 'Qu' tile, A is too short and the E next to an S
+    # has no A next to it
+    assert set(words) == {'QUIT', 'QUITE', 'SQUIT', 'TIE'}
+    for word, path in words.items():
+        check_path(BOARD, word, path)
+    assert len(words['QUITE']) == 4
+    assert max_score(words) == 16 + 25 + 25 + 9
+
+
+def test_matches_brute_force():
+    lexicon = REGISTRY.get_lexicon(DEFAULT_LEXICON)
+    words = solve_board(BOARD, lexicon)
+    for word, path in words.items():
+        check_path(BOARD, word, path)
+    short = {word for word, path in words.items() if len(path) <= MAX_TILES}
+    assert short == brute_force(BOARD, lexicon)
+    assert len(short) < len(words)  # longer words were found as well
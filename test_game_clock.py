@@ -0,0 +1,73 @@
+#############################################################
+# FILE: test_game_clock.py
+# AUTHORS: 1. Amir Harel
+#          2. Nadav Porat
+# EXERCISE: Exercise 12
+# DESCRIPTION: Tests for the countdown clock, on a clock the test moves
+#############################################################
+
+import pytest
+
+from game_clock import GameClock
+
+
+class FakeTime:
+    """
+    a monotonic clock that only moves when the test says so
+    """
+
+    def __init__(self, now=100.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def time():
+    return FakeTime()
+
+
+def test_not_started(time):
+    clock = GameClock(10, time)
+    assert not clock.is_running() and not clock.is_over()
+    assert clock.get_elapsed() == 0.0 and clock.get_display_seconds() == 10
+
+
+@pytest.mark.parametrize('elapsed, shown, next_change', [
+    (0.0, 10, 1000),
+    (0.001, 10, 999),
+    (0.5, 10, 500),
+    (0.9996, 10, 1),  # never asks to be called back right away
+    (1.0, 9, 1000),
+    (8.75, 2, 250),
+])
+def test_display_changes_on_second_boundaries(time, elapsed, shown,
+                                              next_change):
+    clock = GameClock(10, time).start()
+    time.now += elapsed
+    assert clock.get_display_seconds() == shown
+    assert clock.get_next_change() == next_change
+    # waiting the time asked for shows the next second
+    time.now += next_change / 1000
+    assert clock.get_display_seconds() == shown - 1
+
+
+def test_late_callbacks_do_not_stretch_the_game(time):
+    clock = GameClock(10, time).start()
+    time.now += 12.5
+    assert clock.is_over() and not clock.is_running()
+    assert clock.get_remaining() == 0 and clock.get_display_seconds() == 0
+    assert clock.get_elapsed() == 10
+
+
+def test_stop_freezes_the_clock(time):
+    clock = GameClock(10, time).start()
+    time.now += 3.25
+    clock.stop()
+    time.now += 4
+    clock.stop()  # stopping again keeps the first stop
+    assert not clock.is_running() and not clock.is_over()
+    assert clock.get_elapsed() == 3.25 and clock.get_display_seconds() == 7
+    clock.start()  # starting again counts the whole duration
+    assert clock.is_running() and clock.get_remaining() == 10
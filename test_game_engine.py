@@ -0,0 +1,111 @@
+#############################################################
+# FILE: test_game_engine.py
+# AUTHORS: 1. Amir Harel
+#          2. Nadav Porat
+# EXERCISE: Exercise 12
+# DESCRIPTION: Tests for the rules of a game, played without a display
+#############################################################
+
+import pytest
+
+from game_engine import GameEngine
+from lexicon import Lexicon
+
+BOARD = [['C', 'A', 'T', 'S'],
+         ['Qu', 'I', 'E', 'T'],
+         ['X', 'X', 'X', 'X'],
+         ['X', 'X', 'X', 'X']]
+WORDS = ['CAT', 'CATS', 'QUIET', 'QUITE', 'TAC', 'DOG']
+
+
+@pytest.fixture
+def game():
+    return GameEngine(BOARD, Lexicon(WORDS))
+
+
+def press_all(game, *locations):
+    for location in locations:
+        assert game.press(location)
+
+
+def test_erase_unpresses_the_last_tile(game):
+    press_all(game, (0, 0), (0, 1), (0, 2))
+    game.erase_letter()
+    assert game.get_word() == 'CA'
+    assert game.get_path() == [(0, 0), (0, 1)]
+    press_all(game, (0, 2), (0, 3))
+    assert game.get_word() == 'CATS'
+    assert game.check_word() == ('impressive', 16)
+
+
+def test_erase_with_nothing_formed(game):
+    game.erase_letter()
+    assert game.get_word() == '' and game.get_path() == []
+
+
+def test_erase_typed_letter(game):
+    for letter in 'cats':
+        game.type_letter(letter)
+    game.erase_letter()
+    assert game.get_word() == 'CAT'
+    assert game.get_path() == [(0, 0), (0, 1), (0, 2)]
+
+
+def test_press_and_undo_multi_letter_face(game):
+    press_all(game, (1, 0), (1, 1))
+    assert game.get_word() == 'QUI'
+    assert not game.press((0, 3))  # not next to the last tile
+    assert not game.press((1, 0))  # pressed already, but not the last
+    press_all(game, (1, 1))  # the last tile again undoes it
+    assert game.get_word() == 'QU' and game.get_path() == [(1, 0)]
+    press_all(game, (1, 0))
+    assert game.get_word() == '' and game.get_path() == []
+
+
+def test_typed_word_is_followed_on_the_board(game):
+    assert not game.type_letter('q')  # half of the 'Qu' tile
+    assert game.type_letter('u') and game.is_typing()
+    for letter in 'iet':
+        game.type_letter(letter)
+    assert game.get_path()[:3] == [(1, 0), (1, 1), (1, 2)]
+    assert game.get_path()[3] in [(0, 2), (1, 3)]  # either T
+    assert game.check_word() == ('impressive', 25)
+    assert not game.is_typing() and game.get_word() == ''
+
+
+def test_pressing_a_tile_starts_over_from_the_tiles(game):
+    game.type_letter('x')
+    press_all(game, (0, 0))
+    assert not game.is_typing() and game.get_word() == 'C'
+
+
+def test_scoring(game):
+    press_all(game, (0, 0), (0, 1), (0, 2))
+    assert game.check_word() == ('basic', 9)
+    press_all(game, (0, 0), (0, 1), (0, 2))
+    assert game.check_word() == ('recycle', 0)
+    for letter in 'dog':  # a word, but not on the board
+        assert not game.type_letter(letter)
+    assert game.check_word() == ('wrong', 0)
+    for letter in 'quite':
+        game.type_letter(letter)
+    assert game.check_word() == ('impressive', 25)
+    assert game.get_score() == 34
+    assert game.get_bank() == ['CAT', 'QUITE']
+
+
+def test_hint_is_the_shortest_word_not_found(game):
+    assert len(game.get_hint()) == 3
+    for word in ['CAT', 'TAC']:
+        for letter in word:
+            game.type_letter(letter)
+        game.check_word()
+    assert len(game.get_hint()) == 4  # CATS, 'Qu' is one tile of QUIET
+
+
+def test_given_answer_key_is_not_computed_again():
+    solution = {'CAT': [(0, 0), (0, 1), (0, 2)]}
+    game = GameEngine(BOARD, Lexicon(WORDS), solution, best_score=9)
+    assert game.get_solution() is solution
+    assert game.get_report().get_max_score() == 9
+    assert GameEngine(BOARD, Lexicon(WORDS)).get_max_score() > 9
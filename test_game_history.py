@@ -0,0 +1,59 @@
+#############################################################
+# FILE: test_game_history.py
+# AUTHORS: 1. Amir Harel
+#          2. Nadav Porat
+# EXERCISE: Exercise 12
+# DESCRIPTION: Tests for the saved games and the leaderboard queries
+#############################################################
+
+import pytest
+
+from game_history import GameHistory
+
+BOARD = [['A', 'B'], ['C', 'D']]
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / 'history.sqlite3')
+
+
+def test_recorded_game_is_shown_before_and_after_it_is_written(path):
+    history = GameHistory(path)
+    history.record('amir', BOARD, ['AB'], 4, 180.0, played_at=1.0)
+    assert history.top() == [('amir', BOARD, ['AB'], 4, 180.0, 1.0)]
+    history.flush()
+    assert history.count() == 1
+    history.close()
+    assert GameHistory(path).top() == [('amir', BOARD, ['AB'], 4, 180.0,
+                                        1.0)]
+
+
+def test_queries(path):
+    history = GameHistory(path)
+    for score, player in enumerate(['amir', 'nadav', 'amir', 'nadav']):
+        history.record(player, BOARD, [], score, 1.0, played_at=score)
+        if score == 1:
+            history.flush()  # half of the games written, half pending
+    assert [game[3] for game in history.top(3)] == [3, 2, 1]
+    assert [game[3] for game in history.top(5, 'amir')] == [2, 0]
+    assert [game[5] for game in history.history('nadav', 1)] == [3]
+    assert history.count() == 4 and history.count('amir') == 2
+
+
+def test_games_sharing_a_database(path):
+    first, second = GameHistory(path), GameHistory(path)
+    for score in range(50):
+        first.record('amir', BOARD, [], score, 1.0)
+        second.record('nadav', BOARD, [], score, 1.0)
+    first.close()
+    second.close()
+    history = GameHistory(path)
+    assert history.count('amir') == 50 and history.count('nadav') == 50
+
+
+def test_database_that_cant_be_made_is_kept_in_memory(tmp_path):
+    history = GameHistory(str(tmp_path / 'missing' / 'history.sqlite3'))
+    history.record('amir', BOARD, [], 7, 1.0)
+    history.flush()
+    assert history.count() == 1 and history.top()[0][3] == 7
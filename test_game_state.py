@@ -0,0 +1,34 @@
+#############################################################
+# FILE: test_game_state.py
+# AUTHORS: 1. Amir Harel
+#          2. Nadav Porat
+# EXERCISE: Exercise 12
+# DESCRIPTION: Tests for the states of a game and the events between them
+#############################################################
+
+from game_state import ENDED, IDLE, RUNNING, GameStateMachine
+
+
+def test_a_round():
+    events = GameStateMachine()
+    ticks = []
+    events.on('tick', ticks.append)
+    assert events.fire('start') and events.get_state() == RUNNING
+    assert events.fire('tick', 59)
+    assert events.fire('end') and events.get_state() == ENDED
+    assert events.fire('retry') and events.get_state() == IDLE
+    assert ticks == [59]
+
+
+def test_ignored_event():
+    events = GameStateMachine()
+    assert not events.fire('end')
+    assert events.get_state() == IDLE
+
+
+def test_exit_during_the_countdown():
+    events = GameStateMachine()
+    exits = []
+    events.on('exit', lambda: exits.append(True))
+    events.fire('start')
+    assert events.fire('exit') and exits == [True]
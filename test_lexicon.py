@@ -0,0 +1,71 @@
+#############################################################
+# FILE: test_lexicon.py
+# AUTHORS: 1. Amir Harel
+#          2. Nadav Porat
+# EXERCISE: Exercise 12
+# DESCRIPTION: Tests for the lexicons and the compiled word graph
+#############################################################
+
+import os
+
+import pytest
+
+from lexicon import CompiledLexicon, Lexicon, build_dawg, compile_lexicon, \
+    load_lexicon
+
+WORDS = ['A', 'AB', 'ABLE', 'ABLER', 'CABLE', 'CABLES', 'TABLE', 'TABLES',
+         'QUIT', 'QUITE', 'ZZZ']
+
+
+@pytest.fixture(params=['trie', 'compiled'])
+def lexicon(request):
+    if request.param == 'trie':
+        return Lexicon(WORDS)
+    return CompiledLexicon(compile_lexicon(WORDS))
+
+
+def test_membership(lexicon):
+    assert len(lexicon) == len(WORDS)
+    assert sorted(lexicon) == sorted(WORDS)
+    for word in WORDS:
+        assert word in lexicon
+    for word in ['', 'ABL', 'CABLESS', 'QU', 'Z']:
+        assert word not in lexicon
+
+
+def test_prefixes(lexicon):
+    assert lexicon.is_prefix('CAB') and lexicon.is_prefix('')
+    assert not lexicon.is_prefix('CAT')
+    assert sorted(lexicon.iter_prefix('TAB')) == ['TABLE', 'TABLES']
+    assert sorted(lexicon.iter_prefix()) == sorted(WORDS)
+    assert list(lexicon.iter_prefix('X')) == []
+
+
+def test_node_api(lexicon):
+    node = lexicon.get_root()
+    for letter in 'QUIT':
+        node = lexicon.get_child(node, letter)
+    assert lexicon.is_word(node)
+    assert lexicon.get_child(node, 'S') is None
+    assert not lexicon.is_word(lexicon.get_node('QUI'))
+
+
+def test_word_graph_shares_common_suffixes():
+    root = build_dawg(sorted(WORDS))
+    cable = root.edges['C'].edges['A']
+    assert cable is root.edges['T'].edges['A']  # -ABLE and -ABLES
+    assert cable is not root.edges['A']  # A and AB are words, CA isn't
+    compiled = CompiledLexicon(compile_lexicon(WORDS))
+    assert compiled.get_node('CA') == compiled.get_node('TA')
+
+
+def test_compiled_file_is_reused_until_the_dictionary_changes(tmp_path):
+    path = tmp_path / 'words.txt'
+    path.write_text('\n'.join(WORDS) + '\n')
+    assert sorted(load_lexicon(str(path))) == sorted(WORDS)
+    compiled = tmp_path / 'words.lex'
+    modified = os.stat(compiled).st_mtime_ns
+    load_lexicon(str(path))
+    assert os.stat(compiled).st_mtime_ns == modified
+    path.write_text('\n'.join(WORDS + ['NEW']) + '\n')
+    assert 'NEW' in load_lexicon(str(path))
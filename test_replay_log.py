@@ -0,0 +1,124 @@
+#############################################################
+# FILE: test_replay_log.py
+# AUTHORS: 1. Amir Harel
+#          2. Nadav Porat
+# EXERCISE: Exercise 12
+# DESCRIPTION: Tests for writing, reading and replaying the replay log
+#############################################################
+
+import pytest
+
+import replay_log
+from game_engine import GameEngine
+from lexicon import Lexicon
+from replay_log import CHECK, END, ERASE, PRESS, ROUND, TYPE, \
+    ReplayWriter, iter_rounds, read_events, replay_round, summarise
+
+BOARD = [['C', 'A', 'T', 'S'],
+         ['Qu', 'I', 'E', 'T'],
+         ['X', 'X', 'X', 'X'],
+         ['X', 'X', 'X', 'X']]
+LEXICON = Lexicon(['CAT', 'CATS', 'QUIET', 'QUITE'])
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / 'replay.bin')
+
+
+def play_round(writer, player='amir'):
+    writer.start_round(BOARD, player)
+    game = GameEngine(BOARD, LEXICON, log=writer)
+    for location in [(0, 0), (0, 1), (0, 2), (0, 3)]:
+        game.press(location)
+    game.erase_letter()
+    game.check_word()
+    for letter in 'quiet':
+        game.type_letter(letter)
+    game.check_word()
+    writer.end_round(game.get_score())
+    return game
+
+
+def test_round_is_read_and_replayed(path):
+    writer = ReplayWriter(path)
+    game = play_round(writer)
+    writer.close()
+    kinds = [event[0] for event in read_events(path)]
+    assert kinds[0] == ROUND and kinds[-1] == END
+    assert kinds.count(PRESS) == 4 and kinds.count(TYPE) == 5
+    assert kinds.count(ERASE) == 1 and kinds.count(CHECK) == 2
+    (round,) = iter_rounds(path)
+    assert round.get_board() == BOARD and round.get_player() == 'amir'
+    assert round.get_score() == game.get_score() == 9 + 25
+    replayed, mismatches = replay_round(round, LEXICON)
+    assert replayed.get_score() == game.get_score() and not mismatches
+
+
+def test_log_is_appended_to(path):
+    for player in ['amir', 'nadav']:
+        writer = ReplayWriter(path)
+        play_round(writer, player)
+        writer.close()
+    assert [round.get_player() for round in iter_rounds(path)] \
+        == ['amir', 'nadav']
+    assert summarise(path)['finished'] == 2
+
+
+def test_long_text_is_cut_between_characters(path):
+    writer = ReplayWriter(path)
+    play_round(writer, 'é' * 200)
+    writer.close()
+    (round,) = iter_rounds(path)
+    assert round.get_player() == 'é' * 127
+
+
+def test_partly_written_event_is_ignored(path):
+    writer = ReplayWriter(path)
+    play_round(writer)
+    writer.close()
+    with open(path, 'rb+') as file:
+        file.truncate(file.seek(0, 2) - 2)
+    assert [event[0] for event in read_events(path)][-1] == CHECK
+
+
+def test_log_that_cant_be_opened_is_turned_off(tmp_path, monkeypatch):
+    monkeypatch.setenv(replay_log.ENV_VAR,
+                       str(tmp_path / 'missing' / 'replay.bin'))
+    assert replay_log.writer_from_env() is None
+
+
+def test_rounds_logged_after_a_partly_written_event_are_read(path):
+    writer = ReplayWriter(path)
+    play_round(writer, 'amir')
+    writer.close()
+    with open(path, 'rb+') as file:
+        file.truncate(file.seek(0, 2) - 2)
+    writer = ReplayWriter(path)
+    play_round(writer, 'nadav')
+    writer.close()
+    rounds = list(iter_rounds(path))
+    assert [round.get_player() for round in rounds] == ['amir', 'nadav']
+    assert rounds[0].get_score() is None  # its end was never written
+    assert rounds[1].get_score() == 9 + 25
+
+
+def test_partly_written_header_is_written_again(path):
+    with open(path, 'wb') as file:
+        file.write(replay_log.FILE_HEADER[:2])
+    writer = ReplayWriter(path)
+    play_round(writer)
+    writer.close()
+    assert summarise(path)['finished'] == 1
+
+
+def test_corrupt_event_raises_value_error(path, monkeypatch):
+    writer = ReplayWriter(path)
+    play_round(writer)
+    writer.close()
+    with open(path, 'ab') as file:
+        file.write(bytes([200]) + bytes(8))
+    with pytest.raises(ValueError):
+        summarise(path)
+    monkeypatch.setenv(replay_log.ENV_VAR, path)
+    assert replay_log.writer_from_env() is None
@@ -0,0 +1,59 @@
+#############################################################
+# FILE: test_typed_paths.py
+# AUTHORS: 1. Amir Harel
+#          2. Nadav Porat
+# EXERCISE: Exercise 12
+# DESCRIPTION: Tests for following a typed word on the board
+#############################################################
+
+from lexicon import Lexicon
+from typed_paths import TypedPaths
+
+BOARD = [['E', 'E', 'E'],
+         ['Qu', 'I', 'T'],
+         ['E', 'E', 'X']]
+LEXICON = Lexicon(['QUIT', 'QUITE', 'EEE', 'QUX'])
+
+
+def type_word(paths, word):
+    for letter in word:
+        paths.push(letter)
+
+
+def test_multi_letter_face_is_typed_letter_by_letter():
+    paths = TypedPaths(BOARD, LEXICON)
+    paths.push('q')
+    assert paths.get_count() == 1 and paths.get_path() is None
+    type_word(paths, 'UIT')
+    assert paths.get_word() == 'QUIT' and paths.is_word()
+    assert paths.get_path() == [(1, 0), (1, 1), (1, 2)]
+
+
+def test_paths_that_continue_the_same_way_are_merged():
+    board = [['E', 'E', 'X'], ['E', 'E', 'X'], ['X', 'X', 'X']]
+    paths = TypedPaths(board, LEXICON)
+    type_word(paths, 'EE')
+    assert paths.get_count() == 4 * 3
+    # 24 orders of three of the four tiles, but only the last tile and the
+    # tiles used matter for what follows
+    type_word(paths, 'E')
+    assert paths.get_count() == 4 * 3
+    assert paths.is_word() and len(set(paths.get_path())) == 3
+
+
+def test_prefix_outside_the_lexicon_drops_every_path():
+    paths = TypedPaths(BOARD, LEXICON)
+    type_word(paths, 'QX')
+    assert not paths.is_prefix() and paths.get_count() == 0
+    paths.pop()
+    assert paths.get_word() == 'Q' and paths.get_count() == 1
+
+
+def test_word_whose_letters_are_not_adjacent_has_no_path():
+    paths = TypedPaths(BOARD, LEXICON)
+    type_word(paths, 'QUITE')
+    assert paths.is_word() and paths.get_path() is not None
+    paths.clear()
+    assert paths.get_word() == '' and len(paths) == 0
+    type_word(paths, 'QUX')
+    assert paths.is_word() and paths.get_path() is None
@@ -0,0 +1,70 @@
+#############################################################
+# FILE: test_word_validator.py
+# AUTHORS: 1. Amir Harel
+#          2. Nadav Porat
+# EXERCISE: Exercise 12
+# DESCRIPTION: Tests for checking submitted words and paths
+#############################################################
+
+import pytest
+
+from lexicon import Lexicon
+from word_validator import BoardValidator, NOT_A_WORD, NOT_ADJACENT, \
+    NOT_ON_BOARD, OFF_BOARD, REUSED_TILE, TOO_SHORT, VALID, WRONG_LETTERS
+
+BOARD = [['C', 'A', 'T', 'S'],
+         ['Qu', 'I', 'E', 'T'],
+         ['X', 'X', 'X', 'X'],
+         ['X', 'X', 'X', 'X']]
+WORDS = ['CAT', 'CATS', 'QUIET', 'QUITE', 'TAC', 'DOG']
+
+
+@pytest.fixture
+def validator():
+    return BoardValidator(BOARD, Lexicon(WORDS))
+
+
+def test_check_word(validator):
+    assert validator.check_word('cat') == VALID
+    assert validator.check_word('QUIET') == VALID
+    assert validator.check_word('DOG') == NOT_ON_BOARD
+    assert validator.check_word('CTA') == NOT_A_WORD
+    assert validator.check_word('C') == TOO_SHORT
+
+
+def test_find_path_follows_multi_letter_faces(validator):
+    path = validator.find_path('QUIET')
+    assert path[0] == (1, 0) and len(path) == 4
+    assert validator.check_path('QUIET', path) == VALID
+    assert validator.find_path('QIET') is None
+
+
+def test_check_path(validator):
+    assert validator.check_path('CAT', [(0, 0), (0, 1), (0, 2)]) == VALID
+    assert validator.check_path('QUIET', [[1, 0], [1, 1], [1, 2], [1, 3]]) \
+        == VALID
+    assert validator.check_path('CAT', [(0, 0), (0, 1), (0, 1)]) \
+        == REUSED_TILE
+    assert validator.check_path('CAT', [(0, 0), (0, 1), (1, 3)]) \
+        == NOT_ADJACENT
+    assert validator.check_path('CAT', [(0, 0), (0, 1), (4, 0)]) \
+        == OFF_BOARD
+    assert validator.check_path('CAT', [(0, 0), (0, 1), (1, 2)]) \
+        == WRONG_LETTERS
+
+
+@pytest.mark.parametrize('path', [5, 'ab', {'a': 1},
+                                  [5], [('a', 'b')], [(0, 0, 0)]])
+def test_malformed_path_is_off_board(validator, path):
+    assert validator.check_path('CAT', path) == OFF_BOARD
+
+
+def test_validate(validator):
+    assert validator.validate(['CAT', 'DOG', 'CAT'],
+                              [None, None, [(0, 0), (0, 1), (0, 2)]]) \
+        == [VALID, NOT_ON_BOARD, VALID]
+
+
+def test_validate_needs_a_path_per_word(validator):
+    with pytest.raises(ValueError):
+        validator.validate(['CAT', 'CATS'], [None])
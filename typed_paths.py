@@ -0,0 +1,105 @@
+#############################################################
+# FILE: typed_paths.py
+# AUTHORS: 1. Amir Harel
+#          2. Nadav Porat
+# EXERCISE: Exercise 12
+# DESCRIPTION: Follows a word typed on the keyboard on the board - every
+#              path that spells what was typed so far, updated per key
+#############################################################
+
+from board_layout import iter_bits, neighbour_masks
+
+
+class TypedPaths:
+    """
+    the paths on a board that spell the typed letters. a path is kept as
+    (last tile, bitmask of its tiles, letters of the last face still to be
+    typed), so paths that can continue the same way are merged. every
+    typed letter only extends the paths that survived the previous one,
+    and a prefix that no word in the lexicon starts with drops them all
+    """
+
+    def __init__(self, board, lexicon):
+        self.__cols = len(board[0])
+        self.__faces = [face.upper() for row in board for face in row]
+        self.__masks = neighbour_masks(len(board), self.__cols)
+        self.__all = (1 << len(self.__faces)) - 1  # every tile on the board
+        self.__lexicon = lexicon
+        self.clear()
+
+    def __len__(self):
+        return len(self.__letters)
+
+    def clear(self):
+        self.__letters = []
+        # one (lexicon node, paths) per typed letter, the paths map
+        # (last, used, pending) -> the tiles of the path
+        self.__stack = [(self.__lexicon.get_root(), {(None, 0, 0): ()})]
+
+    def get_word(self):
+        return ''.join(self.__letters)
+
+    def get_count(self):
+        """
+        returns the number of paths that spell the typed letters
+        """
+        return len(self.__stack[-1][1])
+
+    def push(self, letter):
+        """
+        types letter. returns the number of paths that still spell the
+        typed letters
+        """
+        letter = letter.upper()
+        node, paths = self.__stack[-1]
+        if node is not None:
+            node = self.__lexicon.get_child(node, letter)
+        extended = {}
+        if node is not None:
+            faces, masks = self.__faces, self.__masks
+            for (last, used, pending), tiles in paths.items():
+                if pending:  # in the middle of a face like 'Qu'
+                    face = faces[last]
+                    if face[len(face) - pending] == letter:
+                        extended.setdefault((last, used, pending - 1), tiles)
+                    continue
+                free = (self.__all if last is None else masks[last]) & ~used
+                for index in iter_bits(free):
+                    face = faces[index]
+                    if face[0] == letter:
+                        extended.setdefault(
+                            (index, used | 1 << index, len(face) - 1),
+                            tiles + (index,))
+        self.__letters.append(letter)
+        self.__stack.append((node, extended))
+        return len(extended)
+
+    def pop(self):
+        """
+        erases the last typed letter, the paths before it are kept so this
+        costs nothing
+        """
+        if self.__letters:
+            self.__letters.pop()
+            self.__stack.pop()
+
+    def is_prefix(self):
+        """
+        returns whether some word in the lexicon starts with the typed
+        letters
+        """
+        return self.__stack[-1][0] is not None
+
+    def is_word(self):
+        node = self.__stack[-1][0]
+        return node is not None and self.__lexicon.is_word(node)
+
+    def get_path(self):
+        """
+        returns the locations of a path that spells exactly the typed
+        letters, or None if there is no such path
+        """
+        for (last, used, pending), tiles in self.__stack[-1][1].items():
+            if not pending and tiles:
+                return [divmod(index, self.__cols) for index in tiles]
+        return None
@@ -0,0 +1,199 @@
+#############################################################
+# FILE: word_validator.py
+# AUTHORS: 1. Amir Harel
+#          2. Nadav Porat
+# EXERCISE: Exercise 12
+# DESCRIPTION: Checks words submitted for a board without the screen -
+#              the dictionary, and that a path of adjacent unused tiles
+#              spells them
+#############################################################
+
+import argparse
+import json
+import sys
+import time
+
+from board_layout import iter_bits, neighbour_masks
+from boggle_solver import MIN_WORD_LENGTH
+from lexicon_registry import DEFAULT_LEXICON, REGISTRY
+
+'''Magic Variables'''
+# Results of checking a word
+VALID = 'valid'
+TOO_SHORT = 'too_short'
+NOT_A_WORD = 'not_a_word'
+NOT_ON_BOARD = 'not_on_board'  # no path on the board spells the word
+# Results of checking a claimed path
+OFF_BOARD = 'off_board'  # a location outside the board
+REUSED_TILE = 'reused_tile'
+NOT_ADJACENT = 'not_adjacent'
+WRONG_LETTERS = 'wrong_letters'  # the path spells another word
+SUMMARY = '{} words checked in {:.2f}s ({:.1f}us per word)'
+
+
+class BoardValidator:
+    """
+    checks words and paths against one board. the faces and adjacency
+    masks are prepared once, so checking a whole round's submissions costs
+    a dictionary lookup and a short walk over the board per word
+    """
+
+    def __init__(self, board, lexicon):
+        self.__lexicon = lexicon
+        self.__cols = len(board[0])
+        self.__size = len(board) * self.__cols
+        # faces are uppercased, so 'Qu' is matched as QU
+        self.__faces = [face.upper() for row in board for face in row]
+        self.__masks = neighbour_masks(len(board), self.__cols)
+        # first letter -> bitmask of the tiles whose face starts with it
+        self.__starts = {}
+        for index, face in enumerate(self.__faces):
+            self.__starts[face[0]] = self.__starts.get(face[0], 0) \
+                | 1 << index
+
+    def check_word(self, word):
+        """
+        returns VALID if word is in the dictionary and can be formed on the
+        board, or the reason it can't
+        """
+        word = word.upper()
+        if len(word) < MIN_WORD_LENGTH:
+            return TOO_SHORT
+        if word not in self.__lexicon:
+            return NOT_A_WORD
+        if self.find_path(word) is None:
+            return NOT_ON_BOARD
+        return VALID
+
+    def check_path(self, word, path):
+        """
+        returns VALID if path - a list of (row, col) locations - is a path
+        of adjacent tiles, none used twice, that spells word and word is in
+        the dictionary. otherwise returns the first problem found
+        """
+        word = word.upper()
+        if len(word) < MIN_WORD_LENGTH:
+            return TOO_SHORT
+        if not isinstance(path, (list, tuple)):
+            return OFF_BOARD
+        used = 0
+        last = None
+        spelled = []
+        for location in path:
+            try:
+                row, col = location
+            except (TypeError, ValueError):
+                return OFF_BOARD
+            if not (isinstance(row, int) and isinstance(col, int)
+                    and 0 <= col < self.__cols
+                    and 0 <= row * self.__cols + col < self.__size):
+                return OFF_BOARD
+            index = row * self.__cols + col
+            if used >> index & 1:
+                return REUSED_TILE
+            if last is not None and not self.__masks[last] >> index & 1:
+                return NOT_ADJACENT
+            used |= 1 << index
+            last = index
+            spelled.append(self.__faces[index])
+        if ''.join(spelled) != word:
+            return WRONG_LETTERS
+        if word not in self.__lexicon:
+            return NOT_A_WORD
+        return VALID
+
+    def find_path(self, word):
+        """
+        returns a list of locations that spells word on the board, or None
+        if there is none. only tiles whose face continues the word are
+        visited
+        """
+        word = word.upper()
+        if not word:
+            return None
+        faces, masks = self.__faces, self.__masks
+
+        def visit(index, start, used):
+            face = faces[index]
+            if not word.startswith(face, start):
+                return None
+            start += len(face)
+            if start == len(word):
+                return [index]
+            used |= 1 << index
+            for neighbour in iter_bits(masks[index] & ~used):
+                rest = visit(neighbour, start, used)
+                if rest is not None:
+                    return [index] + rest
+            return None
+
+        for index in iter_bits(self.__starts.get(word[0], 0)):
+            path = visit(index, 0, 0)
+            if path is not None:
+                return [divmod(i, self.__cols) for i in path]
+        return None
+
+    def validate(self, words, paths=None):
+        """
+        checks a batch of words at once. paths, if given, holds the claimed
+        path of every word, or None for a word sent without one. returns the
+        result of every word in order. a word sent again without a path is
+        checked only once
+        """
+        if paths is None:
+            paths = [None] * len(words)
+        elif len(paths) != len(words):
+            raise ValueError(f'{len(words)} words but {len(paths)} paths')
+        checked = {}  # word -> result of check_word
+        results = []
+        for word, path in zip(words, paths):
+            if path is not None:
+                results.append(self.check_path(word, path))
+            else:
+                if word not in checked:
+                    checked[word] = self.check_word(word)
+                results.append(checked[word])
+        return results
+
+
+def validate_words(board, lexicon, words, paths=None):
+    """
+    checks words (and their claimed paths, if given) against board in one
+    call. see BoardValidator.validate
+    """
+    return BoardValidator(board, lexicon).validate(words, paths)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description='Check submitted words against their boards. every '
+                    'input line is a JSON object with a board, a list of '
+                    'words and optionally a list of paths')
+    parser.add_argument('-i', '--input', default='-',
+                        help='input file, - for stdin')
+    parser.add_argument('--lexicon', default=DEFAULT_LEXICON,
+                        choices=REGISTRY.get_names(), help='language')
+    args = parser.parse_args(argv)
+
+    lexicon = REGISTRY.get_lexicon(args.lexicon)
+    source = sys.stdin if args.input == '-' else open(args.input)
+    count = 0
+    seconds = 0.0
+    try:
+        for line in source:
+            batch = json.loads(line)
+            start = time.perf_counter()
+            results = validate_words(batch['board'], lexicon, batch['words'],
+                                     batch.get('paths'))
+            seconds += time.perf_counter() - start
+            count += len(results)
+            print(json.dumps({'words': batch['words'], 'results': results}))
+    finally:
+        if source is not sys.stdin:
+            source.close()
+    print(SUMMARY.format(count, seconds, seconds / (count or 1) * 1e6),
+          file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()